@@ -633,7 +633,7 @@ class ConversationService:
                         message.attachment_ids,
                     ):
                         full_message += chunk.message
-                        all_citations = all_citations + chunk.citations
+                        all_citations.extend(chunk.citations)
 
                     yield ChatMessageResponse(
                         message=full_message, citations=all_citations, tool_calls=[]
@@ -761,7 +761,7 @@ class ConversationService:
                     attachment_ids,
                 ):
                     full_message += chunk.message
-                    all_citations = all_citations + chunk.citations
+                    all_citations.extend(chunk.citations)
 
                 yield ChatMessageResponse(
                     message=full_message, citations=all_citations, tool_calls=[]
@@ -37,14 +37,11 @@ class SessionService:
                     error="No active session found", conversationId=conversation_id
                 )
 
-            # Sort stream keys to get the most recent session
-            stream_keys_decoded = [
+            # Only the most recent session is needed, so take the max key
+            # in one pass instead of sorting them all
+            active_key = max(
                 key.decode() if isinstance(key, bytes) else key for key in stream_keys
-            ]
-            stream_keys_sorted = sorted(stream_keys_decoded, reverse=True)
-
-            # Get the most recent active stream
-            active_key = stream_keys_sorted[0]
+            )
             key_str = active_key
 
             # Extract run_id from key: chat:stream:{conversation_id}:{run_id}
@@ -122,10 +119,11 @@ class SessionService:
             ]
             stream_keys_sorted = sorted(stream_keys_decoded, reverse=True)
 
+            # Extract full run_id from key: chat:stream:{conversation_id}:{run_id}
+            prefix = f"chat:stream:{conversation_id}:"
+
             # Try each stream key until we find one with a valid task status
             for key_str in stream_keys_sorted:
-                # Extract full run_id from key: chat:stream:{conversation_id}:{run_id}
-                prefix = f"chat:stream:{conversation_id}:"
                 run_id = key_str[len(prefix) :]
                 task_status = self.redis_manager.get_task_status(
                     conversation_id, run_id
@@ -1,11 +1,16 @@
 """Agent factory for creating supervisor and delegate agents"""
 
-from typing import List, Dict, Callable, Any
+from functools import lru_cache
+from typing import List, Dict, Callable, Any, NamedTuple
 from pydantic_ai import Agent, Tool
 from pydantic_ai.mcp import MCPServerStreamableHTTP
 from langchain_core.tools import StructuredTool
 
-from .utils.delegation_utils import AgentType
+from .utils.delegation_utils import (
+    AgentType,
+    DELEGATION_TOOL_PREFIX,
+    DELEGATION_TOOL_SUFFIX,
+)
 from .utils.tool_utils import wrap_structured_tools, deduplicate_tools_by_name
 from .agent_instructions import (
     DELEGATE_AGENT_INSTRUCTIONS,
@@ -26,236 +31,82 @@ if TYPE_CHECKING:
 logger = setup_logger(__name__)
 
 
-class AgentFactory:
-    """Factory for creating supervisor and delegate agents"""
-
-    def __init__(
-        self,
-        llm_provider: ProviderService,
-        tools: List[StructuredTool],
-        mcp_servers: List[dict] | None,
-        delegate_agents: Dict[AgentType, AgentConfig],
-        history_processor: Any,
-        create_delegation_function: Callable[[AgentType], Callable],
-        tools_provider: "ToolService | None" = None,
-    ):
-        """Initialize the agent factory
-
-        Args:
-            llm_provider: The LLM provider service
-            tools: List of tools passed from the agent config
-            mcp_servers: Optional MCP servers configuration
-            delegate_agents: Delegate agent configurations
-            history_processor: History processor for managing conversation history
-            create_delegation_function: Function to create delegation functions
-            tools_provider: Optional ToolService for integration agents to get their tools directly.
-                           If provided, integration agents (GitHub, Jira, etc.) will get their tools
-                           from this service instead of filtering from the passed tools list.
-        """
-        self.llm_provider = llm_provider
-        self.tools = tools
-        self.mcp_servers = mcp_servers or []
-        self.delegate_agents = delegate_agents
-        self.history_processor = history_processor
-        self.create_delegation_function = create_delegation_function
-        self.tools_provider = tools_provider
-
-        # Clean tool names (no spaces for pydantic agents)
-        import re
-
-        for i, tool in enumerate(tools):
-            tools[i].name = re.sub(r" ", "", tool.name)
-
-        # Cache for agent instances - keyed by (agent_type, conversation_id) to avoid stale context
-        self._agent_instances: Dict[tuple[AgentType, str], Agent] = {}
-        # Cache for supervisor agents - keyed by conversation_id to avoid stale context
-        self._supervisor_agents: Dict[str, Agent] = {}
-
-    def create_mcp_servers(self) -> List[MCPServerStreamableHTTP]:
-        """Create MCP server instances from configuration"""
-        mcp_toolsets: List[MCPServerStreamableHTTP] = []
-        for mcp_server in self.mcp_servers:
-            try:
-                mcp_server_instance = MCPServerStreamableHTTP(
-                    url=mcp_server["link"], timeout=10.0
-                )
-                mcp_toolsets.append(mcp_server_instance)
-            except Exception as e:
-                logger.warning(
-                    f"Failed to create MCP server {mcp_server.get('name', 'unknown')}: {e}"
-                )
-                continue
-        return mcp_toolsets
-
-    def _filter_tools_by_names(self, tool_names: List[str]) -> List[StructuredTool]:
-        """Filter tools by a list of tool names. Uses keyword matching since tool names may vary."""
-        filtered = []
-        seen_tool_ids = set()  # Track tool IDs already added to avoid duplicates
-
-        # Normalize tool names to keywords (lowercase, split by underscore)
-        tool_keywords = {}
-        for name in tool_names:
-            # Convert "get_jira_issue" -> ["get", "jira", "issue"]
-            keywords = [k for k in name.lower().split("_") if k]  # Filter empty strings
-            tool_keywords[name] = keywords
-
-        for tool in self.tools:
-            tool_id = id(tool)
-            if tool_id in seen_tool_ids:
-                continue  # Skip if already added
-
-            # Tool names are already cleaned (spaces removed) in __init__
-            clean_name = tool.name.lower()
-
-            # Check if this tool matches any of the requested tool names
-            for requested_name, keywords in tool_keywords.items():
-                # Match if all keywords from requested name appear in cleaned tool name
-                if keywords and all(keyword in clean_name for keyword in keywords):
-                    filtered.append(tool)
-                    seen_tool_ids.add(tool_id)
-                    break  # Don't check other patterns for this tool
-        return filtered
-
-    def build_integration_agent_tools(self, agent_type: AgentType) -> List[Tool]:
-        """Build tool list for integration-specific agents
-
-        Integration agents receive their domain-specific tools. Most integration agents
-        focus exclusively on their integration domain, but GitHub agent also receives
-        code changes tools so it can access and commit changes tracked in the conversation.
-
-        If tools_provider is available, integration agents get their tools directly from it.
-        Otherwise, they try to filter from the passed tools list.
-        """
-        # Import code changes tools here to avoid circular imports
-        from app.modules.intelligence.tools.code_changes_manager import (
-            create_code_changes_management_tools,
-        )
-
-        # Define integration-specific tool names
-        integration_tools_map = {
-            AgentType.JIRA: [
-                "get_jira_issue",
-                "search_jira_issues",
-                "create_jira_issue",
-                "update_jira_issue",
-                "add_jira_comment",
-                "transition_jira_issue",
-                "get_jira_projects",
-                "get_jira_project_details",
-                "get_jira_project_users",
-                "link_jira_issues",
-            ],
-            AgentType.GITHUB: [
-                "github_tool",
-                "code_provider_tool",
-                "github_create_branch",
-                "code_provider_create_branch",
-                "github_create_pull_request",
-                "code_provider_create_pr",
-                "github_add_pr_comments",
-                "code_provider_add_pr_comments",
-                "github_update_branch",
-                "code_provider_update_file",
-            ],
-            AgentType.CONFLUENCE: [
-                "get_confluence_spaces",
-                "get_confluence_page",
-                "search_confluence_pages",
-                "get_confluence_space_pages",
-                "create_confluence_page",
-                "update_confluence_page",
-                "add_confluence_comment",
-            ],
-            AgentType.LINEAR: [
-                "get_linear_issue",
-                "update_linear_issue",
-            ],
-        }
-
-        # Get integration-specific tool names
-        integration_tool_names = integration_tools_map.get(agent_type, [])
-
-        # Try to get tools from tools_provider first (preferred), fall back to filtering
-        if self.tools_provider:
-            # Get tools directly from ToolService - this ensures integration agents
-            # always have access to their tools even if not in the agent config
-            integration_tools = self.tools_provider.get_tools(integration_tool_names)
-            logger.info(
-                f"Got {len(integration_tools)} tools from tools_provider for {agent_type.value}: "
-                f"{[t.name for t in integration_tools]}"
-            )
-        else:
-            # Fall back to filtering from passed tools
-            integration_tools = self._filter_tools_by_names(integration_tool_names)
-            logger.info(
-                f"Filtered {len(integration_tools)} tools from passed tools for {agent_type.value}: "
-                f"{[t.name for t in integration_tools]}"
-            )
-
-        wrapped_tools = wrap_structured_tools(integration_tools)
-
-        # GitHub agent also gets code changes tools so it can access tracked changes
-        # for committing to branches/PRs. This uses the same conversation_id-keyed
-        # code changes manager as the rest of the conversation.
-        if agent_type == AgentType.GITHUB:
-            code_changes_tools = create_code_changes_management_tools()
-            wrapped_tools = wrapped_tools + wrap_structured_tools(code_changes_tools)
-            wrapped_tools = deduplicate_tools_by_name(wrapped_tools)
-
-        return wrapped_tools
-
-    def build_delegate_agent_tools(self) -> List[Tool]:
-        """Build the tool list for delegate agents - includes supervisor tools EXCEPT delegation, todo, and requirement tools.
-
-        Subagents get code execution tools and code changes tools, but NOT:
-        - Delegation tools (they don't delegate)
-        - Todo management tools (supervisor-only for coordination)
-        - Requirement verification tools (supervisor-only for verification)
-
-        This ensures subagents focus on execution while the supervisor handles coordination and verification.
-        """
-        # Import tools here to avoid circular imports
-        from app.modules.intelligence.tools.code_changes_manager import (
-            create_code_changes_management_tools,
-        )
-
-        code_changes_tools = create_code_changes_management_tools()
-
-        # Filter out todo and requirement tools from self.tools (supervisor-only)
-        # These tool names should not be available to subagents
-        supervisor_only_tool_names = {
-            # Todo management tools
-            "create_todo",
-            "update_todo_status",
-            "add_todo_note",
-            "get_todo",
-            "list_todos",
-            "get_todo_summary",
-            # Requirement verification tools
-            "add_requirements",
-            "delete_requirements",
-            "get_requirements",
-        }
-
-        # Filter tools to exclude supervisor-only tools
-        filtered_tools = [
-            tool for tool in self.tools if tool.name not in supervisor_only_tool_names
-        ]
-
-        # Subagents get execution tools and code changes, but NOT todo/requirement tools
-        all_tools = wrap_structured_tools(filtered_tools) + wrap_structured_tools(
-            code_changes_tools
-        )
-        return deduplicate_tools_by_name(all_tools)
-
-    def _get_delegation_tool_description(self, agent_type: AgentType) -> str:
-        """Get the description for a delegation tool based on agent type.
+# Integration-specific tool names for each integration agent
+INTEGRATION_AGENT_TOOL_NAMES: Dict[AgentType, List[str]] = {
+    AgentType.JIRA: [
+        "get_jira_issue",
+        "search_jira_issues",
+        "create_jira_issue",
+        "update_jira_issue",
+        "add_jira_comment",
+        "transition_jira_issue",
+        "get_jira_projects",
+        "get_jira_project_details",
+        "get_jira_project_users",
+        "link_jira_issues",
+    ],
+    AgentType.GITHUB: [
+        "github_tool",
+        "code_provider_tool",
+        "github_create_branch",
+        "code_provider_create_branch",
+        "github_create_pull_request",
+        "code_provider_create_pr",
+        "github_add_pr_comments",
+        "code_provider_add_pr_comments",
+        "github_update_branch",
+        "code_provider_update_file",
+    ],
+    AgentType.CONFLUENCE: [
+        "get_confluence_spaces",
+        "get_confluence_page",
+        "search_confluence_pages",
+        "get_confluence_space_pages",
+        "create_confluence_page",
+        "update_confluence_page",
+        "add_confluence_comment",
+    ],
+    AgentType.LINEAR: [
+        "get_linear_issue",
+        "update_linear_issue",
+    ],
+}
+
+# Delegate agent types that get integration-specific tools and instructions
+INTEGRATION_AGENT_TYPES = frozenset(INTEGRATION_AGENT_TOOL_NAMES)
+
+
+def _tool_name_keywords(name: str) -> tuple[str, ...]:
+    """Split a tool name into match keywords: "get_jira_issue" -> ("get", "jira", "issue")"""
+    return tuple(k for k in name.lower().split("_") if k)
+
+
+# Keyword sets used to match integration tools by name, computed once per agent type
+_INTEGRATION_AGENT_TOOL_KEYWORDS: Dict[AgentType, tuple[tuple[str, ...], ...]] = {
+    agent_type: tuple(
+        keywords for keywords in map(_tool_name_keywords, tool_names) if keywords
+    )
+    for agent_type, tool_names in INTEGRATION_AGENT_TOOL_NAMES.items()
+}
+
+# Tool names that should not be available to subagents
+SUPERVISOR_ONLY_TOOL_NAMES = frozenset(
+    {
+        # Todo management tools
+        "create_todo",
+        "update_todo_status",
+        "add_todo_note",
+        "get_todo",
+        "list_todos",
+        "get_todo_summary",
+        # Requirement verification tools
+        "add_requirements",
+        "delete_requirements",
+        "get_requirements",
+    }
+)
 
-        These tools delegate tasks to specialized subagents that can execute
-        the work in isolated contexts.
-        """
-        if agent_type == AgentType.THINK_EXECUTE:
-            description = """🔨 DELEGATE TO SUBAGENT - Spin up a focused worker with ALL your tools to execute specific tasks or reason through problems.
+THINK_EXECUTE_DELEGATION_DESCRIPTION = """🔨 DELEGATE TO SUBAGENT - Spin up a focused worker with ALL your tools to execute specific tasks or reason through problems.
 
 **WHAT IS A SUBAGENT:**
 - A subagent is an isolated execution context with access to ALL your tools (except delegation)
@@ -297,8 +148,9 @@ Call this tool MULTIPLE TIMES in parallel for independent tasks:
 - Subagent streams its work in real-time (visible to user)
 - You receive a "## Task Result" summary for coordination
 - Use the result to inform your next steps"""
-        elif agent_type == AgentType.JIRA:
-            description = """🎫 DELEGATE TO JIRA AGENT - Specialized subagent for ALL Jira operations.
+
+
+JIRA_DELEGATION_DESCRIPTION = """🎫 DELEGATE TO JIRA AGENT - Specialized subagent for ALL Jira operations.
 
 **CRITICAL - USE FOR ANY JIRA-RELATED TASK:**
 This agent handles ALL Jira operations. Use it whenever the task involves:
@@ -340,8 +192,9 @@ Provide comprehensive context:
 **NOTE**: The Jira agent will inform you if it cannot complete a task. If it says it cannot do something, adjust your approach or use a different subagent.
 
 **PARALLELIZATION:** Call multiple times in parallel for independent Jira operations."""
-        elif agent_type == AgentType.GITHUB:
-            description = """🐙 DELEGATE TO GITHUB AGENT - Specialized subagent for ALL GitHub repository operations.
+
+
+GITHUB_DELEGATION_DESCRIPTION = """🐙 DELEGATE TO GITHUB AGENT - Specialized subagent for ALL GitHub repository operations.
 
 **CRITICAL - USE FOR ANY GITHUB-RELATED TASK:**
 This agent handles ALL GitHub operations. Use it whenever the task involves:
@@ -395,8 +248,9 @@ Provide comprehensive context:
 **NOTE**: The GitHub agent will inform you if it cannot complete a task. If it says it cannot do something, adjust your approach or use a different subagent.
 
 **PARALLELIZATION:** Call multiple times in parallel for independent GitHub operations."""
-        elif agent_type == AgentType.CONFLUENCE:
-            description = """📄 DELEGATE TO CONFLUENCE AGENT - Specialized subagent for ALL Confluence documentation operations.
+
+
+CONFLUENCE_DELEGATION_DESCRIPTION = """📄 DELEGATE TO CONFLUENCE AGENT - Specialized subagent for ALL Confluence documentation operations.
 
 **CRITICAL - USE FOR ANY CONFLUENCE-RELATED TASK:**
 This agent handles ALL Confluence operations. Use it whenever the task involves:
@@ -437,8 +291,9 @@ Provide comprehensive context:
 **NOTE**: The Confluence agent will inform you if it cannot complete a task. If it says it cannot do something, adjust your approach or use a different subagent.
 
 **PARALLELIZATION:** Call multiple times in parallel for independent Confluence operations."""
-        elif agent_type == AgentType.LINEAR:
-            description = """📋 DELEGATE TO LINEAR AGENT - Specialized subagent for ALL Linear issue management.
+
+
+LINEAR_DELEGATION_DESCRIPTION = """📋 DELEGATE TO LINEAR AGENT - Specialized subagent for ALL Linear issue management.
 
 **CRITICAL - USE FOR ANY LINEAR-RELATED TASK:**
 This agent handles ALL Linear operations. Use it whenever the task involves:
@@ -474,8 +329,9 @@ Provide comprehensive context:
 **NOTE**: The Linear agent will inform you if it cannot complete a task. If it says it cannot do something, adjust your approach or use a different subagent.
 
 **PARALLELIZATION:** Call multiple times in parallel for independent Linear operations."""
-        else:
-            description = f"""🤖 DELEGATE TO {agent_type.value.upper()} SUBAGENT - Isolated execution with specialized tools.
+
+
+DEFAULT_DELEGATION_DESCRIPTION_TEMPLATE = """🤖 DELEGATE TO {agent_name} SUBAGENT - Isolated execution with specialized tools.
 
 **WHAT IS A SUBAGENT:**
 - An isolated execution context with specialized tools
@@ -497,6 +353,212 @@ Subagents DON'T get your history. Provide comprehensive context:
 
 **PARALLELIZATION:** Call multiple times in parallel for independent tasks."""
 
+# Delegation tool descriptions keyed by subagent type
+_DELEGATION_TOOL_DESCRIPTIONS: Dict[AgentType, str] = {
+    AgentType.THINK_EXECUTE: THINK_EXECUTE_DELEGATION_DESCRIPTION,
+    AgentType.JIRA: JIRA_DELEGATION_DESCRIPTION,
+    AgentType.GITHUB: GITHUB_DELEGATION_DESCRIPTION,
+    AgentType.CONFLUENCE: CONFLUENCE_DELEGATION_DESCRIPTION,
+    AgentType.LINEAR: LINEAR_DELEGATION_DESCRIPTION,
+}
+
+
+@lru_cache(maxsize=None)
+def _get_builtin_tools(kind: str) -> tuple[Tool, ...]:
+    """Wrap a built-in tool set once per process.
+
+    Building a pydantic-ai Tool derives its JSON schema from the function signature,
+    so the stateless todo, code changes and requirement tools are wrapped only once
+    and shared by every factory. Their per-run state lives in ContextVars.
+    """
+    # Import tools here to avoid circular imports
+    from app.modules.intelligence.tools.code_changes_manager import (
+        create_code_changes_management_tools,
+    )
+    from app.modules.intelligence.tools.requirement_verification_tool import (
+        create_requirement_verification_tools,
+    )
+    from app.modules.intelligence.tools.todo_management_tool import (
+        create_todo_management_tools,
+    )
+
+    creators = {
+        "code_changes": create_code_changes_management_tools,
+        "requirements": create_requirement_verification_tools,
+        "todo": create_todo_management_tools,
+    }
+    return tuple(wrap_structured_tools(creators[kind]()))
+
+
+class AgentFactory:
+    """Factory for creating supervisor and delegate agents"""
+
+    def __init__(
+        self,
+        llm_provider: ProviderService,
+        tools: List[StructuredTool],
+        mcp_servers: List[dict] | None,
+        delegate_agents: Dict[AgentType, AgentConfig],
+        history_processor: Any,
+        create_delegation_function: Callable[[AgentType], Callable],
+        tools_provider: "ToolService | None" = None,
+    ):
+        """Initialize the agent factory
+
+        Args:
+            llm_provider: The LLM provider service
+            tools: List of tools passed from the agent config
+            mcp_servers: Optional MCP servers configuration
+            delegate_agents: Delegate agent configurations
+            history_processor: History processor for managing conversation history
+            create_delegation_function: Function to create delegation functions
+            tools_provider: Optional ToolService for integration agents to get their tools directly.
+                           If provided, integration agents (GitHub, Jira, etc.) will get their tools
+                           from this service instead of filtering from the passed tools list.
+        """
+        self.llm_provider = llm_provider
+        self.tools = tools
+        self.mcp_servers = mcp_servers or []
+        self.delegate_agents = delegate_agents
+        self.history_processor = history_processor
+        self.create_delegation_function = create_delegation_function
+        self.tools_provider = tools_provider
+
+        # Clean tool names (no spaces for pydantic agents)
+        import re
+
+        for i, tool in enumerate(tools):
+            tools[i].name = re.sub(r" ", "", tool.name)
+
+        # Cache for agent instances - keyed by (agent_type, conversation_id) to avoid stale context
+        self._agent_instances: Dict[tuple[AgentType, str], Agent] = {}
+        # Cache for supervisor agents - keyed by conversation_id to avoid stale context
+        self._supervisor_agents: Dict[str, Agent] = {}
+        # Delegate tool list only depends on the factory config, built once on first use
+        self._delegate_agent_tools: List[Tool] | None = None
+
+    def create_mcp_servers(self) -> List[MCPServerStreamableHTTP]:
+        """Create MCP server instances from configuration"""
+        mcp_toolsets: List[MCPServerStreamableHTTP] = []
+        for mcp_server in self.mcp_servers:
+            try:
+                mcp_server_instance = MCPServerStreamableHTTP(
+                    url=mcp_server["link"], timeout=10.0
+                )
+                mcp_toolsets.append(mcp_server_instance)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to create MCP server {mcp_server.get('name', 'unknown')}: {e}"
+                )
+                continue
+        return mcp_toolsets
+
+    def _filter_tools_by_keywords(
+        self, keyword_sets: tuple[tuple[str, ...], ...]
+    ) -> List[StructuredTool]:
+        """Filter tools by keyword sets. Uses keyword matching since tool names may vary."""
+        if not keyword_sets or not self.tools:
+            return []
+
+        filtered = []
+        seen_tool_ids = set()  # Track tool IDs already added to avoid duplicates
+
+        for tool in self.tools:
+            tool_id = id(tool)
+            if tool_id in seen_tool_ids:
+                continue  # Skip if already added
+
+            # Tool names are already cleaned (spaces removed) in __init__
+            clean_name = tool.name.lower()
+
+            # Match if all keywords from any requested name appear in cleaned tool name
+            if any(
+                all(keyword in clean_name for keyword in keywords)
+                for keywords in keyword_sets
+            ):
+                filtered.append(tool)
+                seen_tool_ids.add(tool_id)
+        return filtered
+
+    def build_integration_agent_tools(self, agent_type: AgentType) -> List[Tool]:
+        """Build tool list for integration-specific agents
+
+        Integration agents receive their domain-specific tools. Most integration agents
+        focus exclusively on their integration domain, but GitHub agent also receives
+        code changes tools so it can access and commit changes tracked in the conversation.
+
+        If tools_provider is available, integration agents get their tools directly from it.
+        Otherwise, they try to filter from the passed tools list.
+        """
+
+        # Get integration-specific tool names
+        integration_tool_names = INTEGRATION_AGENT_TOOL_NAMES.get(agent_type, [])
+
+        # Try to get tools from tools_provider first (preferred), fall back to filtering
+        if self.tools_provider:
+            # Get tools directly from ToolService - this ensures integration agents
+            # always have access to their tools even if not in the agent config
+            integration_tools = self.tools_provider.get_tools(integration_tool_names)
+            logger.info(
+                f"Got {len(integration_tools)} tools from tools_provider for {agent_type.value}: "
+                f"{[t.name for t in integration_tools]}"
+            )
+        else:
+            # Fall back to filtering from passed tools
+            integration_tools = self._filter_tools_by_keywords(
+                _INTEGRATION_AGENT_TOOL_KEYWORDS.get(agent_type, ())
+            )
+            logger.info(
+                f"Filtered {len(integration_tools)} tools from passed tools for {agent_type.value}: "
+                f"{[t.name for t in integration_tools]}"
+            )
+
+        wrapped_tools = wrap_structured_tools(integration_tools)
+
+        # GitHub agent also gets code changes tools so it can access tracked changes
+        # for committing to branches/PRs. This uses the same conversation_id-keyed
+        # code changes manager as the rest of the conversation.
+        if agent_type == AgentType.GITHUB:
+            wrapped_tools.extend(_get_builtin_tools("code_changes"))
+            wrapped_tools = deduplicate_tools_by_name(wrapped_tools)
+
+        return wrapped_tools
+
+    def build_delegate_agent_tools(self) -> List[Tool]:
+        """Build the tool list for delegate agents - includes supervisor tools EXCEPT delegation, todo, and requirement tools.
+
+        Subagents get code execution tools and code changes tools, but NOT:
+        - Delegation tools (they don't delegate)
+        - Todo management tools (supervisor-only for coordination)
+        - Requirement verification tools (supervisor-only for verification)
+
+        This ensures subagents focus on execution while the supervisor handles coordination and verification.
+        """
+        if self._delegate_agent_tools is not None:
+            return self._delegate_agent_tools
+
+        # Filter out todo and requirement tools from self.tools (supervisor-only)
+        filtered_tools = [
+            tool for tool in self.tools if tool.name not in SUPERVISOR_ONLY_TOOL_NAMES
+        ]
+
+        # Subagents get execution tools and code changes, but NOT todo/requirement tools
+        all_tools = wrap_structured_tools(filtered_tools)
+        all_tools.extend(_get_builtin_tools("code_changes"))
+        self._delegate_agent_tools = deduplicate_tools_by_name(all_tools)
+        return self._delegate_agent_tools
+
+    def _get_delegation_tool_description(self, agent_type: AgentType) -> str:
+        """Get the description for a delegation tool based on agent type.
+
+        These tools delegate tasks to specialized subagents that can execute
+        the work in isolated contexts.
+        """
+        description = _DELEGATION_TOOL_DESCRIPTIONS.get(agent_type)
+        if description is None:
+            description = DEFAULT_DELEGATION_DESCRIPTION_TEMPLATE.format(
+                agent_name=agent_type.value.upper()
+            )
         return description
 
     def build_delegation_tools(self) -> List[Tool]:
@@ -513,7 +575,7 @@ Subagents DON'T get your history. Provide comprehensive context:
             description = self._get_delegation_tool_description(agent_type)
             delegation_tools.append(
                 Tool(
-                    name=f"delegate_to_{agent_type.value}_agent",
+                    name=f"{DELEGATION_TOOL_PREFIX}{agent_type.value}{DELEGATION_TOOL_SUFFIX}",
                     description=description,
                     function=self.create_delegation_function(agent_type),
                 )
@@ -522,31 +584,14 @@ Subagents DON'T get your history. Provide comprehensive context:
 
     def build_supervisor_agent_tools(self) -> List[Tool]:
         """Build the tool list for supervisor agent including delegation, todo, code changes, and requirement verification tools"""
-        # Import tools here to avoid circular imports
-        from app.modules.intelligence.tools.todo_management_tool import (
-            create_todo_management_tools,
-        )
-        from app.modules.intelligence.tools.code_changes_manager import (
-            create_code_changes_management_tools,
-        )
-        from app.modules.intelligence.tools.requirement_verification_tool import (
-            create_requirement_verification_tools,
-        )
-
-        todo_tools = create_todo_management_tools()
-        code_changes_tools = create_code_changes_management_tools()
-        requirement_tools = create_requirement_verification_tools()
-
         # Create delegation tools - these are subagent tools that can execute tasks
         delegation_tools = self.build_delegation_tools()
 
-        all_tools = (
-            wrap_structured_tools(self.tools)
-            + delegation_tools
-            + wrap_structured_tools(todo_tools)
-            + wrap_structured_tools(code_changes_tools)
-            + wrap_structured_tools(requirement_tools)
-        )
+        all_tools = wrap_structured_tools(self.tools)
+        all_tools.extend(delegation_tools)
+        all_tools.extend(_get_builtin_tools("todo"))
+        all_tools.extend(_get_builtin_tools("code_changes"))
+        all_tools.extend(_get_builtin_tools("requirements"))
         # Deduplicate tools by name before returning
         return deduplicate_tools_by_name(all_tools)
 
@@ -557,15 +602,7 @@ Subagents DON'T get your history. Provide comprehensive context:
         if cache_key in self._agent_instances:
             return self._agent_instances[cache_key]
 
-        # Determine if this is an integration agent
-        integration_agents = {
-            AgentType.JIRA,
-            AgentType.GITHUB,
-            AgentType.CONFLUENCE,
-            AgentType.LINEAR,
-        }
-
-        if agent_type in integration_agents:
+        if agent_type in INTEGRATION_AGENT_TYPES:
             # Use integration-specific tools and instructions
             tools = self.build_integration_agent_tools(agent_type)
             instructions = get_integration_agent_instructions(agent_type.value)
@@ -630,63 +667,78 @@ Subagents DON'T get your history. Provide comprehensive context:
         return supervisor_agent
 
 
-def create_integration_agents() -> Dict[AgentType, AgentConfig]:
-    """Create integration-specific agents (Jira, GitHub, Confluence, Linear)"""
+class _IntegrationAgentSpec(NamedTuple):
+    """Hand-written settings for one integration agent"""
+
+    role: str
+    goal: str
+    backstory: str
+    task_description: str
+    expected_output: str
+
+
+_INTEGRATION_AGENT_SPECS: Dict[AgentType, _IntegrationAgentSpec] = {
+    AgentType.JIRA: _IntegrationAgentSpec(
+        role="Jira Integration Specialist",
+        goal="Handle all Jira operations including issue management, search, and workflow transitions",
+        backstory="You are a specialized agent for Jira operations. You handle issue creation, updates, searches, comments, and status transitions efficiently in an isolated context.",
+        task_description='Execute Jira operations as requested by the supervisor. Use Jira tools to search, create, update, comment on, and transition issues. Return results in "## Task Result" format with issue keys and links.',
+        expected_output="Completed Jira operations with issue keys, URLs, and relevant details",
+    ),
+    AgentType.GITHUB: _IntegrationAgentSpec(
+        role="GitHub Integration Specialist",
+        goal="Handle all GitHub repository operations including PRs, branches, and commits",
+        backstory="You are a specialized agent for GitHub operations. You handle pull requests, branches, file updates, and PR comments efficiently in an isolated context.",
+        task_description='Execute GitHub operations as requested by the supervisor. Use GitHub tools to create branches, PRs, update files, and add comments. Return results in "## Task Result" format with PR numbers, branch names, and GitHub URLs.',
+        expected_output="Completed GitHub operations with PR numbers, branch names, commit SHAs, and GitHub URLs",
+    ),
+    AgentType.CONFLUENCE: _IntegrationAgentSpec(
+        role="Confluence Integration Specialist",
+        goal="Handle all Confluence documentation operations including pages, spaces, and search",
+        backstory="You are a specialized agent for Confluence operations. You handle page creation, updates, searches, and comments efficiently in an isolated context.",
+        task_description='Execute Confluence operations as requested by the supervisor. Use Confluence tools to search spaces, get/create/update pages, and add comments. Return results in "## Task Result" format with page IDs, titles, and Confluence URLs.',
+        expected_output="Completed Confluence operations with space keys, page IDs, titles, and Confluence URLs",
+    ),
+    AgentType.LINEAR: _IntegrationAgentSpec(
+        role="Linear Integration Specialist",
+        goal="Handle Linear issue management operations including fetching and updating issues",
+        backstory="You are a specialized agent for Linear operations. You handle issue fetching and updates efficiently in an isolated context.",
+        task_description='Execute Linear operations as requested by the supervisor. Use Linear tools to get issue details and update issue fields. Return results in "## Task Result" format with issue IDs, titles, and Linear URLs.',
+        expected_output="Completed Linear operations with issue IDs, titles, statuses, and Linear URLs",
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_integration_agent_configs() -> Dict[AgentType, AgentConfig]:
+    """Build the integration agent configs once; they are never mutated"""
     return {
-        AgentType.JIRA: AgentConfig(
-            role="Jira Integration Specialist",
-            goal="Handle all Jira operations including issue management, search, and workflow transitions",
-            backstory="""You are a specialized agent for Jira operations. You handle issue creation, updates, searches, comments, and status transitions efficiently in an isolated context.""",
-            tasks=[
-                TaskConfig(
-                    description="""Execute Jira operations as requested by the supervisor. Use Jira tools to search, create, update, comment on, and transition issues. Return results in "## Task Result" format with issue keys and links.""",
-                    expected_output="Completed Jira operations with issue keys, URLs, and relevant details",
-                )
-            ],
-            max_iter=15,
-        ),
-        AgentType.GITHUB: AgentConfig(
-            role="GitHub Integration Specialist",
-            goal="Handle all GitHub repository operations including PRs, branches, and commits",
-            backstory="""You are a specialized agent for GitHub operations. You handle pull requests, branches, file updates, and PR comments efficiently in an isolated context.""",
-            tasks=[
-                TaskConfig(
-                    description="""Execute GitHub operations as requested by the supervisor. Use GitHub tools to create branches, PRs, update files, and add comments. Return results in "## Task Result" format with PR numbers, branch names, and GitHub URLs.""",
-                    expected_output="Completed GitHub operations with PR numbers, branch names, commit SHAs, and GitHub URLs",
-                )
-            ],
-            max_iter=15,
-        ),
-        AgentType.CONFLUENCE: AgentConfig(
-            role="Confluence Integration Specialist",
-            goal="Handle all Confluence documentation operations including pages, spaces, and search",
-            backstory="""You are a specialized agent for Confluence operations. You handle page creation, updates, searches, and comments efficiently in an isolated context.""",
+        agent_type: AgentConfig(
+            role=spec.role,
+            goal=spec.goal,
+            backstory=spec.backstory,
             tasks=[
                 TaskConfig(
-                    description="""Execute Confluence operations as requested by the supervisor. Use Confluence tools to search spaces, get/create/update pages, and add comments. Return results in "## Task Result" format with page IDs, titles, and Confluence URLs.""",
-                    expected_output="Completed Confluence operations with space keys, page IDs, titles, and Confluence URLs",
+                    description=spec.task_description,
+                    expected_output=spec.expected_output,
                 )
             ],
             max_iter=15,
-        ),
-        AgentType.LINEAR: AgentConfig(
-            role="Linear Integration Specialist",
-            goal="Handle Linear issue management operations including fetching and updating issues",
-            backstory="""You are a specialized agent for Linear operations. You handle issue fetching and updates efficiently in an isolated context.""",
-            tasks=[
-                TaskConfig(
-                    description="""Execute Linear operations as requested by the supervisor. Use Linear tools to get issue details and update issue fields. Return results in "## Task Result" format with issue IDs, titles, and Linear URLs.""",
-                    expected_output="Completed Linear operations with issue IDs, titles, statuses, and Linear URLs",
-                )
-            ],
-            max_iter=15,
-        ),
+        )
+        for agent_type, spec in _INTEGRATION_AGENT_SPECS.items()
     }
 
 
-def create_default_delegate_agents() -> Dict[AgentType, AgentConfig]:
-    """Create default specialized agents if none provided"""
-    integration_agents = create_integration_agents()
+def create_integration_agents() -> Dict[AgentType, AgentConfig]:
+    """Create integration-specific agents (Jira, GitHub, Confluence, Linear)"""
+    # Fresh dict so callers can add or override entries; the configs are shared
+    return dict(_get_integration_agent_configs())
+
+
+@lru_cache(maxsize=None)
+def _get_default_delegate_agent_configs() -> Dict[AgentType, AgentConfig]:
+    """Build the default delegate agent configs once; they are never mutated"""
+    integration_agents = _get_integration_agent_configs()
     return {
         AgentType.THINK_EXECUTE: AgentConfig(
             role="Task Execution Specialist",
@@ -702,3 +754,8 @@ def create_default_delegate_agents() -> Dict[AgentType, AgentConfig]:
         ),
         **integration_agents,
     }
+
+
+def create_default_delegate_agents() -> Dict[AgentType, AgentConfig]:
+    """Create default specialized agents if none provided"""
+    return dict(_get_default_delegate_agent_configs())
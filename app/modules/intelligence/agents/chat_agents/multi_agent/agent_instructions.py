@@ -191,15 +191,17 @@ LINEAR_AGENT_INSTRUCTIONS = """You are a Linear integration specialist subagent.
 - After Task Result, STOP"""
 
 
+INTEGRATION_AGENT_INSTRUCTIONS = {
+    "jira": JIRA_AGENT_INSTRUCTIONS,
+    "github": GITHUB_AGENT_INSTRUCTIONS,
+    "confluence": CONFLUENCE_AGENT_INSTRUCTIONS,
+    "linear": LINEAR_AGENT_INSTRUCTIONS,
+}
+
+
 def get_integration_agent_instructions(agent_type: str) -> str:
     """Get instructions for integration-specific agents"""
-    instructions_map = {
-        "jira": JIRA_AGENT_INSTRUCTIONS,
-        "github": GITHUB_AGENT_INSTRUCTIONS,
-        "confluence": CONFLUENCE_AGENT_INSTRUCTIONS,
-        "linear": LINEAR_AGENT_INSTRUCTIONS,
-    }
-    return instructions_map.get(agent_type, DELEGATE_AGENT_INSTRUCTIONS)
+    return INTEGRATION_AGENT_INSTRUCTIONS.get(agent_type, DELEGATE_AGENT_INSTRUCTIONS)
 
 
 def get_supervisor_instructions(
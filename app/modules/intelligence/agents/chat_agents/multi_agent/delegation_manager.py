@@ -10,6 +10,7 @@ from .delegation_streamer import (
 )
 from .utils.delegation_utils import (
     AgentType,
+    get_agent_type,
     create_delegation_cache_key,
     format_delegation_error,
     extract_task_result_from_response,
@@ -41,7 +42,8 @@ class DelegationManager:
         self.create_delegate_agent = create_delegate_agent
         self.delegation_streamer = delegation_streamer
         self.create_error_response = create_error_response
-        self.tool_call_stream_manager = ToolCallStreamManager()
+        # Redis stream manager, created on first delegation that streams to Redis
+        self._tool_call_stream_manager: Optional[ToolCallStreamManager] = None
 
         # Track active streaming tasks for delegation tools (tool_call_id -> queue)
         self._active_delegation_streams: Dict[str, asyncio.Queue] = {}
@@ -54,6 +56,13 @@ class DelegationManager:
         # Track active streaming tasks by cache_key to detect if they're running
         self._active_streaming_tasks: Dict[str, asyncio.Task] = {}
 
+    @property
+    def tool_call_stream_manager(self) -> ToolCallStreamManager:
+        """Get the Redis tool call stream manager, creating it on first use"""
+        if self._tool_call_stream_manager is None:
+            self._tool_call_stream_manager = ToolCallStreamManager()
+        return self._tool_call_stream_manager
+
     def create_delegation_function(self, agent_type: AgentType) -> Callable:
         """Create a delegation function for a specific agent type.
 
@@ -248,13 +257,14 @@ class DelegationManager:
             current_context: Current chat context
             call_id: Optional tool call ID for Redis streaming (if provided, streams to Redis)
         """
-        full_response = ""
+        # Streamed text is collected in parts and joined once the stream ends
+        response_parts: List[str] = []
         collected_chunks: List[ChatAgentResponse] = []
         subagent_error_occurred = False  # Track if subagent reported an error
 
         try:
             # Convert agent type string to AgentType enum
-            agent_type = AgentType(agent_type_str)
+            agent_type = get_agent_type(agent_type_str)
 
             # Create the delegate agent with all tools
             delegate_agent = self.create_delegate_agent(agent_type, current_context)
@@ -293,7 +303,7 @@ class DelegationManager:
             )
 
             chunk_count = 0
-            stream_start_time = asyncio.get_event_loop().time()
+            stream_start_time = asyncio.get_running_loop().time()
             last_chunk_time = stream_start_time
             # Align with AGENT_ITER_TIMEOUT from delegation_streamer (600s = 10 min)
             # Add buffer for cleanup and error handling
@@ -327,7 +337,7 @@ class DelegationManager:
 
                 while True:
                     loop_iteration += 1
-                    current_loop_time = asyncio.get_event_loop().time()
+                    current_loop_time = asyncio.get_running_loop().time()
 
                     # Heartbeat log every 10 seconds to show we're still in the loop
                     if current_loop_time - last_heartbeat_time >= heartbeat_interval:
@@ -342,25 +352,25 @@ class DelegationManager:
                         last_heartbeat_time = current_loop_time
 
                     if loop_iteration % 10 == 0:  # Log every 10 iterations
-                        elapsed = asyncio.get_event_loop().time() - stream_start_time
+                        elapsed = asyncio.get_running_loop().time() - stream_start_time
                         logger.debug(
                             f"[SUBAGENT STREAM] Chunk loop iteration #{loop_iteration} "
                             f"(agent_type={agent_type.value}, chunks={chunk_count}, elapsed={elapsed:.1f}s)"
                         )
 
                     # Check for overall timeout
-                    elapsed = asyncio.get_event_loop().time() - stream_start_time
+                    elapsed = asyncio.get_running_loop().time() - stream_start_time
                     if elapsed > stream_timeout:
                         logger.error(
                             f"[SUBAGENT STREAM] Stream timeout after {elapsed:.1f}s (agent_type={agent_type.value}, "
                             f"cache_key={cache_key}, call_id={call_id}). Received {chunk_count} chunks, "
-                            f"{len(full_response)} chars. Caching partial result."
+                            f"{sum(map(len, response_parts))} chars. Caching partial result."
                         )
                         break
 
                     # Get next chunk with timeout
                     # Note: Keep-alive messages during tool execution prevent this from timing out
-                    time_before_chunk = asyncio.get_event_loop().time()
+                    time_before_chunk = asyncio.get_running_loop().time()
                     time_since_last_chunk = time_before_chunk - last_chunk_time
                     if (
                         time_since_last_chunk > 5.0
@@ -381,9 +391,9 @@ class DelegationManager:
                             stream_gen.__anext__(), timeout=chunk_timeout
                         )
                         chunk_wait_time = (
-                            asyncio.get_event_loop().time() - time_before_chunk
+                            asyncio.get_running_loop().time() - time_before_chunk
                         )
-                        last_chunk_time = asyncio.get_event_loop().time()
+                        last_chunk_time = asyncio.get_running_loop().time()
                         if chunk_wait_time > 5.0:  # Log if wait was long
                             logger.info(
                                 f"[SUBAGENT STREAM] Received chunk after {chunk_wait_time:.2f}s wait "
@@ -396,7 +406,7 @@ class DelegationManager:
                             )
                     except StopAsyncIteration:
                         # Stream completed normally
-                        elapsed = asyncio.get_event_loop().time() - stream_start_time
+                        elapsed = asyncio.get_running_loop().time() - stream_start_time
                         logger.info(
                             f"[SUBAGENT STREAM] Stream completed normally after {elapsed:.1f}s "
                             f"(agent_type={agent_type.value}, cache_key={cache_key}, "
@@ -405,17 +415,17 @@ class DelegationManager:
                         break
                     except asyncio.TimeoutError:
                         time_since_last_chunk = (
-                            asyncio.get_event_loop().time() - last_chunk_time
+                            asyncio.get_running_loop().time() - last_chunk_time
                         )
                         elapsed_total = (
-                            asyncio.get_event_loop().time() - stream_start_time
+                            asyncio.get_running_loop().time() - stream_start_time
                         )
                         logger.warning(
                             f"[SUBAGENT STREAM] ⚠️ Chunk timeout after {chunk_timeout}s "
                             f"(agent_type={agent_type.value}, cache_key={cache_key}, call_id={call_id}). "
                             f"Last chunk was #{chunk_count} ({time_since_last_chunk:.1f}s ago). "
                             f"Total elapsed: {elapsed_total:.1f}s. "
-                            f"Caching partial result with {len(full_response)} chars. "
+                            f"Caching partial result with {sum(map(len, response_parts))} chars. "
                             f"This may indicate the subagent generator is stuck waiting for a tool or node."
                         )
                         break
@@ -427,12 +437,15 @@ class DelegationManager:
                     )
 
                     # Filter out tool calls - we only want text responses from subagents
-                    # Create a clean chunk with only text content (no tool calls)
-                    text_only_chunk = ChatAgentResponse(
-                        response=chunk.response or "",
-                        tool_calls=[],  # Don't stream subagent tool calls to frontend
-                        citations=chunk.citations or [],
-                    )
+                    # Most chunks are already text-only, so only rebuild the ones carrying tool calls
+                    if chunk.tool_calls:
+                        text_only_chunk = ChatAgentResponse.model_construct(
+                            response=chunk.response or "",
+                            tool_calls=[],  # Don't stream subagent tool calls to frontend
+                            citations=chunk.citations or [],
+                        )
+                    else:
+                        text_only_chunk = chunk
 
                     # Store chunk for later yielding when tool completes
                     collected_chunks.append(text_only_chunk)
@@ -498,7 +511,7 @@ class DelegationManager:
 
                     # Collect text for the final result
                     if chunk.response:
-                        full_response += chunk.response
+                        response_parts.append(chunk.response)
 
             except Exception as stream_error:
                 logger.error(
@@ -509,9 +522,11 @@ class DelegationManager:
                 # Will be handled by outer exception handler
                 raise
 
+            full_response = "".join(response_parts)
+
             # If we broke out due to timeout, cache partial result
             if cache_key not in self._delegation_result_cache:
-                elapsed = asyncio.get_event_loop().time() - stream_start_time
+                elapsed = asyncio.get_running_loop().time() - stream_start_time
                 if elapsed >= stream_timeout or (
                     chunk_count > 0 and elapsed >= chunk_timeout
                 ):
@@ -660,7 +675,7 @@ class DelegationManager:
             self._delegation_streamed_content[cache_key] = collected_chunks
             # CRITICAL: Always cache error result to prevent delegate_function from waiting forever
             error_result = format_delegation_error(
-                AgentType(agent_type_str),
+                get_agent_type(agent_type_str),
                 task_description,
                 type(e).__name__,
                 str(e),
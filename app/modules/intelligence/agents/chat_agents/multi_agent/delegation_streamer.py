@@ -9,9 +9,9 @@ Robust architecture designed to:
 """
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import AsyncGenerator, List, Optional, Any
+from typing import AsyncGenerator, Dict, List, Optional, Any
 from pydantic_ai import Agent
 from pydantic_ai.messages import (
     PartStartEvent,
@@ -41,6 +41,9 @@ TOOL_EXECUTION_TIMEOUT = 300.0  # 5 minutes max for tool execution
 KEEPALIVE_INTERVAL = 30.0  # Emit keepalive every 30 seconds during long operations
 PROGRESS_LOG_INTERVAL = 15.0  # Log progress every 15 seconds
 
+# Shared read-only usage limits: no request limit for long-running tasks
+UNLIMITED_USAGE_LIMITS = UsageLimits(request_limit=None)
+
 
 class SubagentErrorType(Enum):
     """Types of errors that can occur in subagent execution."""
@@ -54,7 +57,7 @@ class SubagentErrorType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class SubagentError:
     """Structured error information from subagent execution."""
 
@@ -98,6 +101,19 @@ class SubagentError:
         return error_header + "\n".join(details)
 
 
+@dataclass(slots=True)
+class _ExecutionState:
+    """Mutable progress of a single subagent run, kept for error reporting."""
+
+    node_count: int = 0
+    response_parts: List[str] = field(default_factory=list)
+
+    @property
+    def partial_response(self) -> str:
+        """Text streamed so far, joined on demand for error reporting."""
+        return "".join(self.response_parts)
+
+
 class SubagentTimeoutError(Exception):
     """Raised when a subagent operation times out."""
 
@@ -117,6 +133,18 @@ class SubagentExecutionError(Exception):
 # Special marker for error responses that the consumer can detect
 ERROR_MARKER = "[[SUBAGENT_ERROR]]"
 
+# Substrings that mark a subagent response as an error
+_SUBAGENT_ERROR_INDICATORS = (
+    ERROR_MARKER,
+    "## ❌ Subagent Error",
+    "*Subagent error:",
+    "*Stream timeout",
+    "*Tool execution timeout*",
+    "*Model request timeout*",
+    "agent timed out after",
+    "agent was cancelled",
+)
+
 
 def is_subagent_error(response: str) -> bool:
     """Check if a subagent response indicates an error.
@@ -130,18 +158,37 @@ def is_subagent_error(response: str) -> bool:
     if not response:
         return False
 
-    error_indicators = [
-        ERROR_MARKER,
-        "## ❌ Subagent Error",
-        "*Subagent error:",
-        "*Stream timeout",
-        "*Tool execution timeout*",
-        "*Model request timeout*",
-        "agent timed out after",
-        "agent was cancelled",
-    ]
+    return any(indicator in response for indicator in _SUBAGENT_ERROR_INDICATORS)
 
-    return any(indicator in response for indicator in error_indicators)
+
+# Lowercased error type indicators, checked in order against a lowercased response
+_ERROR_TYPE_PATTERNS = (
+    (SubagentErrorType.TIMEOUT, ("timed out", "timeout", "(timeout)")),
+    (SubagentErrorType.STREAM_TIMEOUT, ("stream_timeout", "stream timeout")),
+    (SubagentErrorType.TOOL_TIMEOUT, ("tool_timeout", "tool execution timeout")),
+    (SubagentErrorType.API_ERROR, ("api_error", "api issue")),
+    (SubagentErrorType.TOOL_ERROR, ("tool_error", "tool failed")),
+    (SubagentErrorType.CANCELLED, ("cancelled", "was cancelled")),
+)
+
+# Error types the supervisor may retry
+_RECOVERABLE_ERROR_TYPES = frozenset(
+    {
+        SubagentErrorType.STREAM_TIMEOUT,
+        SubagentErrorType.TOOL_TIMEOUT,
+        SubagentErrorType.API_ERROR,
+    }
+)
+
+# Supervisor-facing suggestion for each error type
+_ERROR_SUGGESTIONS: Dict[SubagentErrorType, str] = {
+    SubagentErrorType.TIMEOUT: "Try a simpler or more focused task.",
+    SubagentErrorType.STREAM_TIMEOUT: "The model response was incomplete. Try again or simplify.",
+    SubagentErrorType.TOOL_TIMEOUT: "A tool took too long. The integration may be slow.",
+    SubagentErrorType.API_ERROR: "There was an API issue. Retry may help.",
+    SubagentErrorType.TOOL_ERROR: "A tool failed. Check if the tool parameters are correct.",
+    SubagentErrorType.UNKNOWN: "An unexpected error occurred.",
+}
 
 
 def extract_error_type_from_response(response: str) -> Optional[SubagentErrorType]:
@@ -157,17 +204,9 @@ def extract_error_type_from_response(response: str) -> Optional[SubagentErrorTyp
         return None
 
     # Check for specific error type indicators
-    error_type_patterns = {
-        SubagentErrorType.TIMEOUT: ["timed out", "timeout", "(timeout)"],
-        SubagentErrorType.STREAM_TIMEOUT: ["stream_timeout", "Stream timeout"],
-        SubagentErrorType.TOOL_TIMEOUT: ["tool_timeout", "Tool execution timeout"],
-        SubagentErrorType.API_ERROR: ["api_error", "API issue"],
-        SubagentErrorType.TOOL_ERROR: ["tool_error", "Tool failed"],
-        SubagentErrorType.CANCELLED: ["cancelled", "was cancelled"],
-    }
-
-    for error_type, patterns in error_type_patterns.items():
-        if any(pattern.lower() in response.lower() for pattern in patterns):
+    response_lower = response.lower()
+    for error_type, patterns in _ERROR_TYPE_PATTERNS:
+        if any(pattern in response_lower for pattern in patterns):
             return error_type
 
     if is_subagent_error(response):
@@ -210,14 +249,10 @@ class DelegationStreamer:
         )
 
         reasoning_manager = _get_reasoning_manager()
-        start_time = asyncio.get_event_loop().time()
+        start_time = asyncio.get_running_loop().time()
 
         # Track execution state for error reporting
-        execution_state = {
-            "node_count": 0,
-            "partial_response": "",
-            "last_error": None,
-        }
+        execution_state = _ExecutionState()
 
         logger.info(
             f"[SUBAGENT] Starting for agent_type={agent_type}, "
@@ -236,20 +271,20 @@ class DelegationStreamer:
             ):
                 # Track partial response for error reporting
                 if response.response and not response.response.startswith(ERROR_MARKER):
-                    execution_state["partial_response"] += response.response
+                    execution_state.response_parts.append(response.response)
                 yield response
 
         except asyncio.TimeoutError:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = asyncio.get_running_loop().time() - start_time
             logger.error(
                 f"[SUBAGENT] ⚠️ TIMEOUT after {elapsed:.1f}s (agent_type={agent_type}, "
-                f"nodes={execution_state['node_count']})"
+                f"nodes={execution_state.node_count})"
             )
             yield self._create_timeout_response(
                 agent_type,
                 elapsed,
-                partial_response=execution_state["partial_response"],
-                node_count=execution_state["node_count"],
+                partial_response=execution_state.partial_response,
+                node_count=execution_state.node_count,
             )
 
         except asyncio.CancelledError:
@@ -258,7 +293,7 @@ class DelegationStreamer:
             raise
 
         except SubagentTimeoutError as e:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = asyncio.get_running_loop().time() - start_time
             logger.error(
                 f"[SUBAGENT] Subagent timeout after {elapsed:.1f}s (agent_type={agent_type}): {e}"
             )
@@ -272,12 +307,12 @@ class DelegationStreamer:
                 yield self._create_timeout_response(
                     agent_type,
                     elapsed,
-                    partial_response=execution_state["partial_response"],
-                    node_count=execution_state["node_count"],
+                    partial_response=execution_state.partial_response,
+                    node_count=execution_state.node_count,
                 )
 
         except SubagentExecutionError as e:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = asyncio.get_running_loop().time() - start_time
             logger.error(
                 f"[SUBAGENT] Execution error after {elapsed:.1f}s (agent_type={agent_type}): {e}"
             )
@@ -293,18 +328,19 @@ class DelegationStreamer:
                     str(e),
                     error_type=SubagentErrorType.UNKNOWN,
                     elapsed=elapsed,
-                    partial_response=execution_state["partial_response"],
-                    node_count=execution_state["node_count"],
+                    partial_response=execution_state.partial_response,
+                    node_count=execution_state.node_count,
                 )
 
         except Exception as e:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = asyncio.get_running_loop().time() - start_time
             error_str = str(e)
 
             # Classify error type based on exception
-            if "timeout" in error_str.lower():
+            error_lower = error_str.lower()
+            if "timeout" in error_lower:
                 error_type = SubagentErrorType.TIMEOUT
-            elif "api" in error_str.lower() or "rate" in error_str.lower():
+            elif "api" in error_lower or "rate" in error_lower:
                 error_type = SubagentErrorType.API_ERROR
             else:
                 error_type = SubagentErrorType.UNKNOWN
@@ -319,16 +355,16 @@ class DelegationStreamer:
                 error_str,
                 error_type=error_type,
                 elapsed=elapsed,
-                partial_response=execution_state["partial_response"],
-                node_count=execution_state["node_count"],
+                partial_response=execution_state.partial_response,
+                node_count=execution_state.node_count,
             )
 
         finally:
-            elapsed = asyncio.get_event_loop().time() - start_time
+            elapsed = asyncio.get_running_loop().time() - start_time
             logger.info(
                 f"[SUBAGENT] Finished after {elapsed:.1f}s (agent_type={agent_type}, "
-                f"nodes={execution_state['node_count']}, "
-                f"response_length={len(execution_state['partial_response'])})"
+                f"nodes={execution_state.node_count}, "
+                f"response_length={len(execution_state.partial_response)})"
             )
 
     async def _run_agent_with_timeout(
@@ -338,7 +374,7 @@ class DelegationStreamer:
         agent_type: str,
         message_history: Optional[List[ModelMessage]],
         reasoning_manager: Any,
-        execution_state: dict,
+        execution_state: _ExecutionState,
     ) -> AsyncGenerator[ChatAgentResponse, None]:
         """Run agent with overall timeout wrapper and event-driven monitoring."""
 
@@ -346,7 +382,7 @@ class DelegationStreamer:
             async with agent.iter(
                 user_prompt=user_prompt,
                 message_history=message_history or [],
-                usage_limits=UsageLimits(request_limit=None),
+                usage_limits=UNLIMITED_USAGE_LIMITS,
             ) as run:
                 logger.info(
                     f"[SUBAGENT] agent.iter() started (agent_type={agent_type})"
@@ -359,18 +395,18 @@ class DelegationStreamer:
                 node_iteration_timeout = 180.0  # 3 minutes max to get next node
                 consecutive_node_timeouts = 0
                 max_consecutive_node_timeouts = 2  # Allow 2 consecutive timeouts
-                last_progress_log = asyncio.get_event_loop().time()
+                last_progress_log = asyncio.get_running_loop().time()
                 agent_start_time = last_progress_log
 
                 while True:
-                    current_time = asyncio.get_event_loop().time()
+                    current_time = asyncio.get_running_loop().time()
 
                     # Progress logging
                     if current_time - last_progress_log >= PROGRESS_LOG_INTERVAL:
                         total_elapsed = current_time - agent_start_time
                         logger.info(
                             f"[SUBAGENT] 📊 Progress: agent_type={agent_type}, "
-                            f"nodes={execution_state['node_count']}, elapsed={total_elapsed:.1f}s"
+                            f"nodes={execution_state.node_count}, elapsed={total_elapsed:.1f}s"
                         )
                         last_progress_log = current_time
 
@@ -390,7 +426,7 @@ class DelegationStreamer:
                     except asyncio.TimeoutError:
                         consecutive_node_timeouts += 1
                         total_elapsed = (
-                            asyncio.get_event_loop().time() - agent_start_time
+                            asyncio.get_running_loop().time() - agent_start_time
                         )
 
                         if consecutive_node_timeouts >= max_consecutive_node_timeouts:
@@ -436,9 +472,9 @@ class DelegationStreamer:
                         )
                         break
 
-                    execution_state["node_count"] += 1
-                    node_count = execution_state["node_count"]
-                    node_start = asyncio.get_event_loop().time()
+                    execution_state.node_count += 1
+                    node_count = execution_state.node_count
+                    node_start = asyncio.get_running_loop().time()
 
                     try:
                         async for response in self._process_node_with_timeout(
@@ -446,14 +482,14 @@ class DelegationStreamer:
                         ):
                             yield response
 
-                        node_elapsed = asyncio.get_event_loop().time() - node_start
+                        node_elapsed = asyncio.get_running_loop().time() - node_start
                         if node_elapsed > 10:  # Log if node took > 10s
                             logger.info(
                                 f"[SUBAGENT] Node #{node_count} completed in {node_elapsed:.1f}s"
                             )
 
                     except asyncio.TimeoutError:
-                        node_elapsed = asyncio.get_event_loop().time() - node_start
+                        node_elapsed = asyncio.get_running_loop().time() - node_start
                         logger.warning(
                             f"[SUBAGENT] Node #{node_count} timeout after {node_elapsed:.1f}s - continuing to next node"
                         )
@@ -490,12 +526,12 @@ class DelegationStreamer:
 
         # Use asyncio.wait_for with overall timeout
         gen = _run_agent()
-        deadline = asyncio.get_event_loop().time() + AGENT_ITER_TIMEOUT
+        deadline = asyncio.get_running_loop().time() + AGENT_ITER_TIMEOUT
 
         try:
             async for response in gen:
                 # Check if we've exceeded the overall deadline
-                if asyncio.get_event_loop().time() > deadline:
+                if asyncio.get_running_loop().time() > deadline:
                     raise asyncio.TimeoutError("Agent execution exceeded deadline")
                 yield response
         finally:
@@ -580,7 +616,7 @@ class DelegationStreamer:
                 logger.info(f"[SUBAGENT] Node #{node_count}: stream entered")
                 event_count = 0
                 yield_count = 0
-                last_event_time = asyncio.get_event_loop().time()
+                last_event_time = asyncio.get_running_loop().time()
                 last_keepalive_time = last_event_time
                 stream_start_time = last_event_time
                 consecutive_timeouts = 0
@@ -590,7 +626,7 @@ class DelegationStreamer:
                 stream_iter = request_stream.__aiter__()
 
                 while True:
-                    current_time = asyncio.get_event_loop().time()
+                    current_time = asyncio.get_running_loop().time()
 
                     # Emit keepalive if it's been a while since last yield
                     # This prevents upstream timeouts during long-running operations
@@ -613,7 +649,7 @@ class DelegationStreamer:
                         event = await asyncio.wait_for(
                             stream_iter.__anext__(), timeout=EVENT_TIMEOUT
                         )
-                        last_event_time = asyncio.get_event_loop().time()
+                        last_event_time = asyncio.get_running_loop().time()
                         last_keepalive_time = last_event_time  # Reset keepalive timer
                         consecutive_timeouts = 0  # Reset timeout counter on success
 
@@ -627,10 +663,10 @@ class DelegationStreamer:
                     except asyncio.TimeoutError:
                         consecutive_timeouts += 1
                         elapsed_total = (
-                            asyncio.get_event_loop().time() - stream_start_time
+                            asyncio.get_running_loop().time() - stream_start_time
                         )
                         time_since_event = (
-                            asyncio.get_event_loop().time() - last_event_time
+                            asyncio.get_running_loop().time() - last_event_time
                         )
 
                         if consecutive_timeouts >= max_consecutive_timeouts:
@@ -657,7 +693,7 @@ class DelegationStreamer:
                                 tool_calls=[],
                                 citations=[],
                             )
-                            last_keepalive_time = asyncio.get_event_loop().time()
+                            last_keepalive_time = asyncio.get_running_loop().time()
                             continue  # Retry getting the next event
 
                     except asyncio.CancelledError:
@@ -679,13 +715,13 @@ class DelegationStreamer:
 
                     event_count += 1
 
-                    # Handle text events
+                    # Handle text events (built without re-validation, per token)
                     if isinstance(event, PartStartEvent) and isinstance(
                         event.part, TextPart
                     ):
                         reasoning_manager.append_content(event.part.content)
                         yield_count += 1
-                        yield ChatAgentResponse(
+                        yield ChatAgentResponse.model_construct(
                             response=event.part.content,
                             tool_calls=[],
                             citations=[],
@@ -696,7 +732,7 @@ class DelegationStreamer:
                     ):
                         reasoning_manager.append_content(event.delta.content_delta)
                         yield_count += 1
-                        yield ChatAgentResponse(
+                        yield ChatAgentResponse.model_construct(
                             response=event.delta.content_delta,
                             tool_calls=[],
                             citations=[],
@@ -723,7 +759,7 @@ class DelegationStreamer:
                                 citations=[],
                             )
                             yield_count = event_count
-                            last_keepalive_time = asyncio.get_event_loop().time()
+                            last_keepalive_time = asyncio.get_running_loop().time()
 
             finally:
                 # Always properly exit the stream context with timeout
@@ -795,14 +831,15 @@ class DelegationStreamer:
                 )
                 return
 
-            tool_start = asyncio.get_event_loop().time()  # Initialize before try block
+            # Initialize before try block
+            tool_start = asyncio.get_running_loop().time()
             try:
                 logger.info(f"[SUBAGENT] Node #{node_count}: tool stream entered")
                 last_keepalive_time = tool_start
                 event_count = 0
 
                 async for event in tool_stream:
-                    current_time = asyncio.get_event_loop().time()
+                    current_time = asyncio.get_running_loop().time()
                     elapsed = current_time - tool_start
                     event_count += 1
 
@@ -861,7 +898,7 @@ class DelegationStreamer:
                 raise
 
             except Exception as e:
-                elapsed = asyncio.get_event_loop().time() - tool_start
+                elapsed = asyncio.get_running_loop().time() - tool_start
                 logger.error(
                     f"[SUBAGENT] Node #{node_count}: error during tool execution "
                     f"(tool={current_tool_name}, elapsed={elapsed:.1f}s): {e}",
@@ -962,23 +999,6 @@ class DelegationStreamer:
         # Truncate error message to avoid huge responses
         error_msg = error[:500] + "..." if len(error) > 500 else error
 
-        # Determine if error is recoverable based on type
-        recoverable = error_type in [
-            SubagentErrorType.STREAM_TIMEOUT,
-            SubagentErrorType.TOOL_TIMEOUT,
-            SubagentErrorType.API_ERROR,
-        ]
-
-        # Provide suggestions based on error type
-        suggestions = {
-            SubagentErrorType.TIMEOUT: "Try a simpler or more focused task.",
-            SubagentErrorType.STREAM_TIMEOUT: "The model response was incomplete. Try again or simplify.",
-            SubagentErrorType.TOOL_TIMEOUT: "A tool took too long. The integration may be slow.",
-            SubagentErrorType.API_ERROR: "There was an API issue. Retry may help.",
-            SubagentErrorType.TOOL_ERROR: "A tool failed. Check if the tool parameters are correct.",
-            SubagentErrorType.UNKNOWN: "An unexpected error occurred.",
-        }
-
         error_info = SubagentError(
             error_type=error_type,
             message=error_msg,
@@ -986,8 +1006,8 @@ class DelegationStreamer:
             elapsed_seconds=elapsed,
             node_count=node_count,
             partial_response=partial_response,
-            recoverable=recoverable,
-            suggestion=suggestions.get(error_type, ""),
+            recoverable=error_type in _RECOVERABLE_ERROR_TYPES,
+            suggestion=_ERROR_SUGGESTIONS.get(error_type, ""),
         )
 
         return ChatAgentResponse(
@@ -1008,15 +1028,14 @@ class DelegationStreamer:
             _get_reasoning_manager,
         )
 
-        full_response = ""
+        response_parts: List[str] = []
         reasoning_manager = _get_reasoning_manager()
 
         async def _collect():
-            nonlocal full_response
             async with agent.iter(
                 user_prompt=user_prompt,
                 message_history=message_history or [],
-                usage_limits=UsageLimits(request_limit=None),
+                usage_limits=UNLIMITED_USAGE_LIMITS,
             ) as run:
                 async for node in run:
                     if Agent.is_model_request_node(node):
@@ -1025,12 +1044,12 @@ class DelegationStreamer:
                                 if isinstance(event, PartStartEvent) and isinstance(
                                     event.part, TextPart
                                 ):
-                                    full_response += event.part.content
+                                    response_parts.append(event.part.content)
                                     reasoning_manager.append_content(event.part.content)
                                 if isinstance(event, PartDeltaEvent) and isinstance(
                                     event.delta, TextPartDelta
                                 ):
-                                    full_response += event.delta.content_delta
+                                    response_parts.append(event.delta.content_delta)
                                     reasoning_manager.append_content(
                                         event.delta.content_delta
                                     )
@@ -1044,6 +1063,6 @@ class DelegationStreamer:
             await asyncio.wait_for(_collect(), timeout=AGENT_ITER_TIMEOUT)
         except asyncio.TimeoutError:
             logger.error("[SUBAGENT] collect_agent_streaming_response timeout")
-            full_response += "\n*Response timed out*\n"
+            response_parts.append("\n*Response timed out*\n")
 
-        return full_response
+        return "".join(response_parts)
@@ -4,8 +4,8 @@ import traceback
 from typing import AsyncGenerator, Any, Optional
 import anyio
 from pydantic_ai.exceptions import ModelHTTPError
-from pydantic_ai.usage import UsageLimits
 
+from .delegation_streamer import UNLIMITED_USAGE_LIMITS
 from .utils.message_history_utils import (
     validate_and_fix_message_history,
     prepare_multimodal_message_history,
@@ -94,10 +94,8 @@ class StandardExecutionFlow:
                     exc_info=True,
                 )
                 # Check if it's a JSON parsing error
-                if (
-                    "json" in str(mcp_error).lower()
-                    or "parse" in str(mcp_error).lower()
-                ):
+                error_lower = str(mcp_error).lower()
+                if "json" in error_lower or "parse" in error_lower:
                     logger.error(
                         f"JSON parsing error during MCP server initialization in standard run - MCP server may be returning malformed or incomplete JSON. Full traceback:\n{traceback.format_exc()}"
                     )
@@ -223,9 +221,7 @@ class StreamingExecutionFlow:
                     async with supervisor_agent.iter(
                         user_prompt=ctx.query,
                         message_history=message_history,
-                        usage_limits=UsageLimits(
-                            request_limit=None
-                        ),  # No request limit for long-running tasks
+                        usage_limits=UNLIMITED_USAGE_LIMITS,
                     ) as run:
                         # Store the supervisor run so delegation functions can access its message history
                         self.current_supervisor_run_ref["run"] = run
@@ -258,10 +254,12 @@ class StreamingExecutionFlow:
                         else str(error_body)
                     )
 
+                    error_message_lower = error_message.lower()
+
                     # Check for duplicate tool_result error
                     if (
-                        "tool_result" in error_message.lower()
-                        and "multiple" in error_message.lower()
+                        "tool_result" in error_message_lower
+                        and "multiple" in error_message_lower
                     ):
                         logger.error(
                             f"Duplicate tool_result error detected in ModelHTTPError: {error_message}. "
@@ -270,8 +268,8 @@ class StreamingExecutionFlow:
                         )
                     # Check for token limit error
                     elif (
-                        "too long" in error_message.lower()
-                        or "maximum" in error_message.lower()
+                        "too long" in error_message_lower
+                        or "maximum" in error_message_lower
                     ):
                         logger.error(
                             f"Token limit exceeded: {error_message}. "
@@ -298,9 +296,7 @@ class StreamingExecutionFlow:
                 async with supervisor_agent.iter(
                     user_prompt=ctx.query,
                     message_history=message_history,
-                    usage_limits=UsageLimits(
-                        request_limit=None
-                    ),  # No request limit for long-running tasks
+                    usage_limits=UNLIMITED_USAGE_LIMITS,
                 ) as run:
                     # Store the supervisor run so delegation functions can access its message history
                     self.current_supervisor_run_ref["run"] = run
@@ -317,11 +313,9 @@ class StreamingExecutionFlow:
 
         except Exception as e:
             error_str = str(e)
+            error_lower = error_str.lower()
             # Check if this is a tool retry error from pydantic-ai
-            if (
-                "exceeded max retries" in error_str.lower()
-                and "tool" in error_str.lower()
-            ):
+            if "exceeded max retries" in error_lower and "tool" in error_lower:
                 # Extract tool name if possible
                 tool_name = "unknown"
                 if "'" in error_str:
@@ -399,9 +393,7 @@ class MultimodalStreamingExecutionFlow:
             async with supervisor_agent.iter(
                 user_prompt=multimodal_content,
                 message_history=message_history,
-                usage_limits=UsageLimits(
-                    request_limit=None
-                ),  # No request limit for long-running tasks
+                usage_limits=UNLIMITED_USAGE_LIMITS,
             ) as run:
                 # Store the supervisor run so delegation functions can access its message history
                 self.current_supervisor_run_ref["run"] = run
@@ -35,6 +35,9 @@ logger = setup_logger(__name__)
 TOOL_NAME_SHOW_UPDATED_FILE = "show_updated_file"
 TOOL_NAME_SHOW_DIFF = "show_diff"
 
+# Suffix for output queue keys fed from a delegation's Redis tool call stream
+REDIS_QUEUE_SUFFIX = "_redis"
+
 
 class StreamProcessor:
     """Processes agent run nodes and handles streaming events"""
@@ -52,7 +55,11 @@ class StreamProcessor:
         """
         self.delegation_manager = delegation_manager
         self.create_error_response = create_error_response
-        self.tool_call_stream_manager = ToolCallStreamManager()
+
+    @property
+    def tool_call_stream_manager(self) -> ToolCallStreamManager:
+        """Redis tool call stream manager, shared with the delegation manager"""
+        return self.delegation_manager.tool_call_stream_manager
 
     @staticmethod
     async def yield_text_stream_events(
@@ -64,11 +71,13 @@ class StreamProcessor:
         )
 
         reasoning_manager = _get_reasoning_manager()
+        # Text events carry model-produced strings, so responses are built without
+        # re-validation on this per-token path
         async for event in request_stream:
             if isinstance(event, PartStartEvent) and isinstance(event.part, TextPart):
                 # Accumulate TextPart content for reasoning dump
                 reasoning_manager.append_content(event.part.content)
-                yield ChatAgentResponse(
+                yield ChatAgentResponse.model_construct(
                     response=event.part.content,
                     tool_calls=[],
                     citations=[],
@@ -78,7 +87,7 @@ class StreamProcessor:
             ):
                 # Accumulate TextPartDelta content for reasoning dump
                 reasoning_manager.append_content(event.delta.content_delta)
-                yield ChatAgentResponse(
+                yield ChatAgentResponse.model_construct(
                     response=event.delta.content_delta,
                     tool_calls=[],
                     citations=[],
@@ -98,11 +107,8 @@ class StreamProcessor:
             return None  # Signal to continue
         elif isinstance(error, ValueError):
             error_str = str(error)
-            if (
-                "json" in error_str.lower()
-                or "parse" in error_str.lower()
-                or "EOF" in error_str
-            ):
+            error_lower = error_str.lower()
+            if "json" in error_lower or "parse" in error_lower or "EOF" in error_str:
                 logger.error(
                     f"JSON parsing error in {context} (likely from malformed tool call in message history): {error}. "
                     f"This may indicate a truncated or incomplete tool call from a previous iteration. "
@@ -118,7 +124,8 @@ class StreamProcessor:
             logger.error(
                 f"Unexpected error in {context}: {error_detail}", exc_info=True
             )
-            if "json" in str(error).lower() or "parse" in str(error).lower():
+            error_lower = str(error).lower()
+            if "json" in error_lower or "parse" in error_lower:
                 return self.create_error_response(
                     "*Encountered a parsing error. Skipping this step and continuing...*"
                 )
@@ -149,6 +156,69 @@ class StreamProcessor:
                 break  # No more chunks available within timeout
         return chunks, False  # Return chunks and not completed
 
+    async def drain_redis_queues(
+        self,
+        queue_keys: List[str],
+        output_queues: Dict[str, asyncio.Queue],
+        drained_streams: set,
+    ) -> AsyncGenerator[ChatAgentResponse, None]:
+        """Drain Redis tool stream queues concurrently, yielding each batch as it is ready
+
+        Redis stream chunks are tagged with their call_id, so batches from different
+        queues can interleave, and a slow subagent doesn't hold back chunks that
+        parallel subagents have already produced. Completed queues are added to
+        drained_streams.
+        """
+
+        async def consume_redis_chunks(queue_key: str):
+            chunks, completed = await self.consume_queue_chunks(
+                output_queues[queue_key], timeout=0.1, max_chunks=50
+            )
+            return queue_key, chunks, completed
+
+        redis_drain_start = asyncio.get_running_loop().time()
+        redis_chunk_counts = dict.fromkeys(queue_keys, 0)
+        pending_redis_keys = list(queue_keys)
+        for attempt in range(20):  # Try up to 20 times
+            drain_tasks = [
+                asyncio.create_task(consume_redis_chunks(key))
+                for key in pending_redis_keys
+            ]
+            try:
+                for next_batch in asyncio.as_completed(drain_tasks):
+                    queue_key, chunks, completed = await next_batch
+                    redis_chunk_counts[queue_key] += len(chunks)
+                    for chunk in chunks:
+                        yield chunk
+                    if completed:
+                        drained_streams.add(queue_key)
+                        redis_drain_elapsed = (
+                            asyncio.get_running_loop().time() - redis_drain_start
+                        )
+                        logger.info(
+                            f"[drain_redis_queues] Final drain completed for {queue_key}: "
+                            f"chunks={redis_chunk_counts[queue_key]}, attempts={attempt + 1}, "
+                            f"elapsed={redis_drain_elapsed:.2f}s"
+                        )
+            finally:
+                # Don't leave consumers reading the queues if the stream is closed mid-drain
+                for task in drain_tasks:
+                    if not task.done():
+                        task.cancel()
+            pending_redis_keys = [
+                key for key in pending_redis_keys if key not in drained_streams
+            ]
+            if not pending_redis_keys:
+                break
+            await asyncio.sleep(0.05)
+
+        redis_drain_elapsed = asyncio.get_running_loop().time() - redis_drain_start
+        for queue_key in pending_redis_keys:
+            logger.warning(
+                f"[drain_redis_queues] ⚠️ Final drain incomplete for {queue_key} after 20 attempts: "
+                f"chunks={redis_chunk_counts[queue_key]}, elapsed={redis_drain_elapsed:.2f}s"
+            )
+
     @staticmethod
     async def yield_tool_result_event(
         event: FunctionToolResultEvent,
@@ -175,16 +245,17 @@ class StreamProcessor:
             )
 
         # For show_updated_file and show_diff, append content directly to response
-        # instead of going through tool_result_info - these stream directly to user
+        # instead of going through tool_result_info - these stream directly to user.
+        # The wrapper only carries the built tool_result, so skip re-validation
         if tool_name in (TOOL_NAME_SHOW_UPDATED_FILE, TOOL_NAME_SHOW_DIFF):
             content = str(event.result.content) if event.result.content else ""
-            yield ChatAgentResponse(
+            yield ChatAgentResponse.model_construct(
                 response=content,
                 tool_calls=[tool_result],
                 citations=[],
             )
         else:
-            yield ChatAgentResponse(
+            yield ChatAgentResponse.model_construct(
                 response="",
                 tool_calls=[tool_result],
                 citations=[],
@@ -204,7 +275,8 @@ class StreamProcessor:
         # IMPORTANT: We keep strong references to node objects, not just their IDs.
         # Using id() alone is unsafe because Python can reuse memory addresses after
         # garbage collection, causing false duplicate detection and missed delegation starts.
-        processed_nodes: list = []  # Keep references to prevent GC
+        # Keyed by id() for O(1) lookup; the stored references keep each id from being reused.
+        processed_nodes: Dict[int, Any] = {}
 
         # Track node counts for debugging
         node_counts = {
@@ -232,7 +304,7 @@ class StreamProcessor:
 
             # Check if we've already processed this exact node object
             # Use 'is' for identity comparison (same object in memory)
-            is_duplicate = any(node is processed for processed in processed_nodes)
+            is_duplicate = processed_nodes.get(id(node)) is node
             if is_duplicate:
                 node_counts["skipped_duplicates"] += 1
                 logger.warning(
@@ -242,7 +314,7 @@ class StreamProcessor:
                 continue
 
             # Keep reference to prevent GC and mark as processed
-            processed_nodes.append(node)
+            processed_nodes[id(node)] = node
             node_counts[node_type] = node_counts.get(node_type, 0) + 1
 
             logger.info(
@@ -443,7 +515,7 @@ class StreamProcessor:
                                     drained_streams.add(queue_key)
                                     output_queues.pop(queue_key, None)
                                     # Only cleanup active_streams and tasks for non-Redis queues
-                                    if not queue_key.endswith("_redis"):
+                                    if not queue_key.endswith(REDIS_QUEUE_SUFFIX):
                                         active_streams.pop(queue_key, None)
                                         self.delegation_manager.remove_active_stream(
                                             queue_key
@@ -468,7 +540,9 @@ class StreamProcessor:
                                                     pass
                                     else:
                                         # Clean up Redis stream task
-                                        actual_call_id = queue_key.replace("_redis", "")
+                                        actual_call_id = queue_key.replace(
+                                            REDIS_QUEUE_SUFFIX, ""
+                                        )
                                         if actual_call_id in redis_stream_tasks:
                                             task = redis_stream_tasks.pop(
                                                 actual_call_id
@@ -521,8 +595,9 @@ class StreamProcessor:
                                 f"context_type={context_type}"
                             )
 
-                        # Yield the tool call event
-                        yield ChatAgentResponse(
+                        # Yield the tool call event; the wrapper only carries a built
+                        # ToolCallResponse, so it is constructed without re-validation
+                        yield ChatAgentResponse.model_construct(
                             response="",
                             tool_calls=[create_tool_call_response(event)],
                             citations=[],
@@ -641,8 +716,10 @@ class StreamProcessor:
                                                     is_complete=is_complete,
                                                 )
 
+                                                # Wrapper holds only the validated
+                                                # stream response; skip re-validation
                                                 await redis_queue.put(
-                                                    ChatAgentResponse(
+                                                    ChatAgentResponse.model_construct(
                                                         response="",
                                                         tool_calls=[
                                                             stream_tool_response
@@ -677,7 +754,7 @@ class StreamProcessor:
                                 )
                                 redis_stream_tasks[tool_call_id] = redis_stream_task
                                 # Store the queue for consumption in the main loop
-                                output_queues[f"{tool_call_id}_redis"] = (
+                                output_queues[f"{tool_call_id}{REDIS_QUEUE_SUFFIX}"] = (
                                     redis_stream_queue
                                 )
 
@@ -778,7 +855,7 @@ class StreamProcessor:
                                 f"[process_tool_call_node] Draining delegation stream for tool_call_id={tool_call_id[:8]}... "
                                 f"(tool_name={tool_name}, context_type={context_type})"
                             )
-                            drain_start_time = asyncio.get_event_loop().time()
+                            drain_start_time = asyncio.get_running_loop().time()
                             # Drain any remaining chunks from output queue
                             if tool_call_id in output_queues:
                                 output_queue = output_queues[tool_call_id]
@@ -799,7 +876,7 @@ class StreamProcessor:
                                         # Mark as drained after completion
                                         drained_streams.add(tool_call_id)
                                         drain_elapsed = (
-                                            asyncio.get_event_loop().time()
+                                            asyncio.get_running_loop().time()
                                             - drain_start_time
                                         )
                                         logger.info(
@@ -812,7 +889,7 @@ class StreamProcessor:
                                     await asyncio.sleep(0.05)
                                 else:
                                     drain_elapsed = (
-                                        asyncio.get_event_loop().time()
+                                        asyncio.get_running_loop().time()
                                         - drain_start_time
                                     )
                                     logger.warning(
@@ -837,7 +914,7 @@ class StreamProcessor:
                             active_streams.pop(tool_call_id, None)
                             output_queues.pop(tool_call_id, None)
                             output_queues.pop(
-                                f"{tool_call_id}_redis", None
+                                f"{tool_call_id}{REDIS_QUEUE_SUFFIX}", None
                             )  # Clean up Redis queue
                             self.delegation_manager.remove_active_stream(tool_call_id)
 
@@ -900,6 +977,7 @@ class StreamProcessor:
                     f"[process_tool_call_node] Starting final drain of {len(output_queues)} output queues "
                     f"(context_type={context_type}, drained_streams={len(drained_streams)})"
                 )
+                final_drain_keys = []
                 for queue_key in list(output_queues.keys()):
                     if queue_key in drained_streams:
                         # Already fully drained, just clean up
@@ -908,7 +986,7 @@ class StreamProcessor:
                         )
                         output_queues.pop(queue_key, None)
                         # Only cleanup active_streams and delegation_manager for non-Redis queues
-                        if not queue_key.endswith("_redis"):
+                        if not queue_key.endswith(REDIS_QUEUE_SUFFIX):
                             active_streams.pop(queue_key, None)
                             self.delegation_manager.remove_active_stream(queue_key)
                         continue
@@ -916,8 +994,15 @@ class StreamProcessor:
                     logger.info(
                         f"[process_tool_call_node] Draining final chunks from queue: {queue_key}"
                     )
+                    final_drain_keys.append(queue_key)
+
+                # Text-only subagent streams carry no call_id to tell their chunks apart,
+                # so drain them one at a time to keep their output from interleaving
+                for queue_key in final_drain_keys:
+                    if queue_key.endswith(REDIS_QUEUE_SUFFIX):
+                        continue
                     output_queue = output_queues[queue_key]
-                    final_drain_start = asyncio.get_event_loop().time()
+                    final_drain_start = asyncio.get_running_loop().time()
                     total_final_chunks = 0
                     # Wait longer for final chunks
                     for attempt in range(20):  # Try up to 20 times
@@ -930,7 +1015,7 @@ class StreamProcessor:
                         if completed:
                             drained_streams.add(queue_key)
                             final_drain_elapsed = (
-                                asyncio.get_event_loop().time() - final_drain_start
+                                asyncio.get_running_loop().time() - final_drain_start
                             )
                             logger.info(
                                 f"[process_tool_call_node] Final drain completed for {queue_key}: "
@@ -941,20 +1026,33 @@ class StreamProcessor:
                         await asyncio.sleep(0.05)
                     else:
                         final_drain_elapsed = (
-                            asyncio.get_event_loop().time() - final_drain_start
+                            asyncio.get_running_loop().time() - final_drain_start
                         )
                         logger.warning(
                             f"[process_tool_call_node] ⚠️ Final drain incomplete for {queue_key} after 20 attempts: "
                             f"chunks={total_final_chunks}, elapsed={final_drain_elapsed:.2f}s"
                         )
+
+                async for chunk in self.drain_redis_queues(
+                    [
+                        key
+                        for key in final_drain_keys
+                        if key.endswith(REDIS_QUEUE_SUFFIX)
+                    ],
+                    output_queues,
+                    drained_streams,
+                ):
+                    yield chunk
+
+                for queue_key in final_drain_keys:
                     output_queues.pop(queue_key, None)
                     # Only cleanup active_streams and delegation_manager for non-Redis queues
-                    if not queue_key.endswith("_redis"):
+                    if not queue_key.endswith(REDIS_QUEUE_SUFFIX):
                         active_streams.pop(queue_key, None)
                         self.delegation_manager.remove_active_stream(queue_key)
                     else:
                         # Clean up Redis stream task for Redis queues
-                        actual_call_id = queue_key.replace("_redis", "")
+                        actual_call_id = queue_key.replace(REDIS_QUEUE_SUFFIX, "")
                         if actual_call_id in redis_stream_tasks:
                             task = redis_stream_tasks.pop(actual_call_id)
                             if not task.done():
@@ -964,15 +1062,15 @@ class StreamProcessor:
                                 except asyncio.CancelledError:
                                     pass
 
-                # Cancel any remaining streaming tasks
-                for tool_call_id, task in list(streaming_tasks.items()):
-                    if not task.done():
-                        task.cancel()
-                        try:
-                            await task
-                        except asyncio.CancelledError:
-                            pass
-                    streaming_tasks.pop(tool_call_id, None)
+                # Cancel any remaining streaming tasks together rather than awaiting one by one
+                pending_tasks = [
+                    task for task in streaming_tasks.values() if not task.done()
+                ]
+                for task in pending_tasks:
+                    task.cancel()
+                if pending_tasks:
+                    await asyncio.gather(*pending_tasks, return_exceptions=True)
+                streaming_tasks.clear()
 
                 # CRITICAL: For supervisor context, wait for all delegation cached results to be available
                 # before closing the stream. This ensures tool result events are generated and processed.
@@ -999,7 +1097,7 @@ class StreamProcessor:
                         pending_keys = set(
                             cache_key for _, cache_key in delegation_cache_keys
                         )
-                        wait_start_time = asyncio.get_event_loop().time()
+                        wait_start_time = asyncio.get_running_loop().time()
 
                         while pending_keys and waited < max_wait:
                             # Check which cache keys have results
@@ -1020,7 +1118,7 @@ class StreamProcessor:
 
                             if not pending_keys:
                                 wait_elapsed = (
-                                    asyncio.get_event_loop().time() - wait_start_time
+                                    asyncio.get_running_loop().time() - wait_start_time
                                 )
                                 logger.info(
                                     f"[process_tool_call_node] All delegation cached results available, "
@@ -1033,7 +1131,7 @@ class StreamProcessor:
 
                             if int(waited) % 5 == 0:
                                 wait_elapsed = (
-                                    asyncio.get_event_loop().time() - wait_start_time
+                                    asyncio.get_running_loop().time() - wait_start_time
                                 )
                                 # Check task status for pending keys
                                 task_statuses = {}
@@ -1054,7 +1152,7 @@ class StreamProcessor:
 
                         if pending_keys:
                             wait_elapsed = (
-                                asyncio.get_event_loop().time() - wait_start_time
+                                asyncio.get_running_loop().time() - wait_start_time
                             )
                             logger.error(
                                 f"[process_tool_call_node] ⚠️ TIMEOUT waiting for {len(pending_keys)} cached results "
@@ -1084,9 +1182,9 @@ class StreamProcessor:
             AgentRunError,
             UserError,
         ) as pydantic_error:
-            error_str = str(pydantic_error)
+            error_lower = str(pydantic_error).lower()
             # Check for duplicate tool_result error specifically
-            if "tool_result" in error_str.lower() and "multiple" in error_str.lower():
+            if "tool_result" in error_lower and "multiple" in error_lower:
                 logger.error(
                     f"Duplicate tool_result error in tool call stream: {pydantic_error}. "
                     f"This indicates pydantic_ai's internal message history has duplicate tool results. "
@@ -1105,9 +1203,9 @@ class StreamProcessor:
         except anyio.WouldBlock:
             logger.warning("Tool call stream would block - continuing...")
         except Exception as e:
-            error_str = str(e)
+            error_lower = str(e).lower()
             # Check for duplicate tool_result error
-            if "tool_result" in error_str.lower() and "multiple" in error_str.lower():
+            if "tool_result" in error_lower and "multiple" in error_lower:
                 logger.error(
                     f"Duplicate tool_result error in tool call stream: {e}. "
                     f"This indicates pydantic_ai's internal message history has duplicate tool results."
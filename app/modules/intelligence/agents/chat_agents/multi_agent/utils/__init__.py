@@ -1,6 +1,7 @@
 """Utility modules for multi-agent system"""
 
 from .delegation_utils import (
+    get_agent_type,
     is_delegation_tool,
     extract_agent_type_from_delegation_tool,
     extract_task_result_from_response,
@@ -30,6 +31,7 @@ from .multimodal_utils import (
 
 __all__ = [
     # Delegation utils
+    "get_agent_type",
     "is_delegation_tool",
     "extract_agent_type_from_delegation_tool",
     "extract_task_result_from_response",
@@ -2,6 +2,13 @@
 
 from app.modules.intelligence.agents.chat_agent import ChatContext
 
+# Static sections of the image context block
+_ATTACHED_IMAGES_HEADER = "ATTACHED IMAGES:"
+_IMAGE_ANALYSIS_NOTES = """Image Analysis Notes:
+- These images are provided for visual analysis and debugging
+- Reference specific details from the images in your response
+- Correlate visual evidence with the user's query"""
+
 
 def create_project_context_info(ctx: ChatContext) -> str:
     """Create project context information for both supervisor and subagents"""
@@ -10,25 +17,6 @@ def create_project_context_info(ctx: ChatContext) -> str:
     if isinstance(ctx.node_ids, str):
         ctx.node_ids = [ctx.node_ids]
 
-    # Add image context information
-    image_context = ""
-    if ctx.has_images():
-        all_images = ctx.get_all_images()
-        image_details = []
-        for attachment_id, image_data in all_images.items():
-            file_name = image_data.get("file_name", "unknown")
-            file_size = image_data.get("file_size", 0)
-            image_details.append(f"- {file_name} ({file_size} bytes)")
-
-        image_context = f"""
-ATTACHED IMAGES:
-{chr(10).join(image_details)}
-
-Image Analysis Notes:
-- These images are provided for visual analysis and debugging
-- Reference specific details from the images in your response
-- Correlate visual evidence with the user's query"""
-
     context_parts = []
 
     # Project information
@@ -40,8 +28,15 @@ Image Analysis Notes:
         context_parts.append(f"Nodes: {', '.join(ctx.node_ids)}")
 
     # Image context
-    if image_context:
-        context_parts.append(image_context.strip())
+    if ctx.has_images():
+        image_details = "\n".join(
+            f"- {image_data.get('file_name', 'unknown')} "
+            f"({image_data.get('file_size', 0)} bytes)"
+            for image_data in ctx.get_all_images().values()
+        )
+        context_parts.append(
+            f"{_ATTACHED_IMAGES_HEADER}\n{image_details}\n\n{_IMAGE_ANALYSIS_NOTES}"
+        )
 
     # Additional context
     if ctx.additional_context:
@@ -20,24 +20,87 @@ class AgentType(Enum):
     LINEAR = "linear"  # Linear Integration Agent
 
 
+# Reverse lookup so string -> AgentType avoids the Enum value scan
+_AGENT_TYPE_BY_VALUE = {agent_type.value: agent_type for agent_type in AgentType}
+
+
+def get_agent_type(value: str) -> AgentType:
+    """Convert an agent type string to its AgentType member"""
+    try:
+        return _AGENT_TYPE_BY_VALUE[value]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid AgentType") from None
+
+
+# Delegation tool names are f"{DELEGATION_TOOL_PREFIX}{agent_type}{DELEGATION_TOOL_SUFFIX}"
+DELEGATION_TOOL_PREFIX = "delegate_to_"
+DELEGATION_TOOL_SUFFIX = "_agent"
+
+
 def is_delegation_tool(tool_name: str) -> bool:
     """Check if a tool call is a delegation to a subagent"""
     # Support both old format (delegate_to_github) and new format (delegate_to_github_agent)
-    return tool_name.startswith("delegate_to_")
+    return tool_name.startswith(DELEGATION_TOOL_PREFIX)
+
+
+# Known delegation tool names mapped to their agent type, so the common case skips parsing
+_DELEGATION_TOOL_AGENT_TYPES = {
+    f"{DELEGATION_TOOL_PREFIX}{agent_type.value}{DELEGATION_TOOL_SUFFIX}": agent_type.value
+    for agent_type in AgentType
+}
 
 
 def extract_agent_type_from_delegation_tool(tool_name: str) -> str:
     """Extract agent type from delegation tool name"""
-    if tool_name.startswith("delegate_to_"):
+    agent_type = _DELEGATION_TOOL_AGENT_TYPES.get(tool_name)
+    if agent_type is not None:
+        return agent_type
+    if tool_name.startswith(DELEGATION_TOOL_PREFIX):
         # Remove "delegate_to_" prefix
-        agent_part = tool_name[12:]
+        agent_part = tool_name[len(DELEGATION_TOOL_PREFIX) :]
         # Remove "_agent" suffix if present (new format)
-        if agent_part.endswith("_agent"):
-            return agent_part[:-6]  # Remove "_agent" suffix
+        if agent_part.endswith(DELEGATION_TOOL_SUFFIX):
+            return agent_part[: -len(DELEGATION_TOOL_SUFFIX)]
         return agent_part
     return tool_name
 
 
+# Error indicators in a subagent response, combined into one case-insensitive scan
+_ERROR_INDICATOR_RE = re.compile(
+    r"❌\s*error"
+    r"|⚠️\s*error"
+    r"|🚨\s*error"
+    r"|error\s*occurred"
+    r"|failed\s*to"
+    r"|exception"
+    r"|traceback",
+    re.IGNORECASE,
+)
+
+# Patterns to match the Task Result section, tried in order
+# Updated patterns to better capture the end of result sections
+_TASK_RESULT_PATTERNS = tuple(
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r"(?i)#{1,4}\s*task\s*result[:\s]*\n(.*?)(?=\n#{1,4}\s*(?!task\s*result)\w+|\Z)",
+        r"(?i)\*\*task\s*result[:\s]*\*\*\n(.*?)(?=\n\*\*(?!task\s*result)\w+|\Z)",
+        r"(?i)task\s*result[:\s]*\n(.*?)(?=\n\w+:|\n#{1,4}\s*\w+|\Z)",
+        r"(?i)## result[:\s]*\n(.*?)(?=\n#{1,4}\s*(?!result)\w+|\Z)",
+        r"(?i)\*\*result[:\s]*\*\*\n(.*?)(?=\n\*\*(?!result)\w+|\Z)",
+    )
+)
+
+# Fallback conclusion or final sections when no Task Result is present
+_CONCLUSION_PATTERNS = tuple(
+    re.compile(pattern, re.DOTALL)
+    for pattern in (
+        r"(?i)#{1,4}\s*conclusion[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
+        r"(?i)#{1,4}\s*summary[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
+        r"(?i)#{1,4}\s*findings[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
+    )
+)
+
+
 def extract_task_result_from_response(response: str) -> str:
     """
     Extract the Task Result section from a subagent response.
@@ -50,46 +113,19 @@ def extract_task_result_from_response(response: str) -> str:
         return ""
 
     # Check for error indicators first
-    error_indicators = [
-        r"(?i)❌\s*error",
-        r"(?i)⚠️\s*error",
-        r"(?i)🚨\s*error",
-        r"(?i)error\s*occurred",
-        r"(?i)failed\s*to",
-        r"(?i)exception",
-        r"(?i)traceback",
-    ]
-
-    for error_pattern in error_indicators:
-        if re.search(error_pattern, response):
-            return response
-
-    # Pattern to match Task Result section (case insensitive)
-    # Updated patterns to better capture the end of result sections
-    patterns = [
-        r"(?i)#{1,4}\s*task\s*result[:\s]*\n(.*?)(?=\n#{1,4}\s*(?!task\s*result)\w+|\Z)",
-        r"(?i)\*\*task\s*result[:\s]*\*\*\n(.*?)(?=\n\*\*(?!task\s*result)\w+|\Z)",
-        r"(?i)task\s*result[:\s]*\n(.*?)(?=\n\w+:|\n#{1,4}\s*\w+|\Z)",
-        r"(?i)## result[:\s]*\n(.*?)(?=\n#{1,4}\s*(?!result)\w+|\Z)",
-        r"(?i)\*\*result[:\s]*\*\*\n(.*?)(?=\n\*\*(?!result)\w+|\Z)",
-    ]
+    if _ERROR_INDICATOR_RE.search(response):
+        return response
 
-    for pattern in patterns:
-        match = re.search(pattern, response, re.DOTALL)
+    for pattern in _TASK_RESULT_PATTERNS:
+        match = pattern.search(response)
         if match:
             summary = match.group(1).strip()
             if summary:
                 return summary
 
     # If no Task Result section is found, look for conclusion or final sections
-    conclusion_patterns = [
-        r"(?i)#{1,4}\s*conclusion[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
-        r"(?i)#{1,4}\s*summary[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
-        r"(?i)#{1,4}\s*findings[:\s]*\n(.*?)(?=\n#{1,4}\s*\w+|\Z)",
-    ]
-
-    for pattern in conclusion_patterns:
-        match = re.search(pattern, response, re.DOTALL)
+    for pattern in _CONCLUSION_PATTERNS:
+        match = pattern.search(response)
         if match:
             summary = match.group(1).strip()
             if summary:
@@ -124,6 +160,34 @@ def extract_task_result_from_response(response: str) -> str:
     return response
 
 
+# Task-independent part of every subagent prompt
+_SUBAGENT_PROMPT_GUIDANCE = """You are a SUBAGENT executing a focused task. You have access to ALL tools to complete this work.
+
+**IMPORTANT - YOU ARE ISOLATED:**
+- You do NOT have access to the supervisor's conversation history
+- You do NOT see previous tool calls or their results
+- The task and context below are ALL the information provided to you
+- Use your tools to gather any additional information you need
+
+**EXECUTION APPROACH:**
+1. Read the task and context carefully
+2. Use tools to gather information (file reads, code searches, etc.)
+3. Execute the task completely - be thorough
+4. Stream your progress - the user sees your work in real-time
+5. Make reasonable assumptions and state them
+
+**TOOL USAGE:**
+- Use fetch_file with with_line_numbers=true for precise file editing
+- Use code changes tools (add_file_to_changes, update_file_lines, insert_lines, delete_lines) for modifications
+- Use show_updated_file and show_diff to display your changes
+- Use bash_command for running commands if needed
+
+**OUTPUT:**
+- Stream your thinking and work as you go
+- End with "## Task Result" containing a concise, actionable summary
+- The supervisor will use your Task Result for coordination"""
+
+
 def create_delegation_prompt(
     task_description: str,
     project_context: str,
@@ -152,7 +216,9 @@ def create_delegation_prompt(
         else "No additional context provided."
     )
 
-    return f"""You are a SUBAGENT executing a focused task. You have access to ALL tools to complete this work.
+    # Static guidance goes first so the prompt prefix is byte-identical across
+    # delegations (provider prompt caching); task-specific content goes last
+    return f"""{_SUBAGENT_PROMPT_GUIDANCE}
 
 **YOUR TASK:**
 {task_description}
@@ -160,30 +226,6 @@ def create_delegation_prompt(
 **AVAILABLE CONTEXT:**
 {full_context}
 
-**IMPORTANT - YOU ARE ISOLATED:**
-- You do NOT have access to the supervisor's conversation history
-- You do NOT see previous tool calls or their results
-- The context above is ALL the information provided to you
-- Use your tools to gather any additional information you need
-
-**EXECUTION APPROACH:**
-1. Read the task and context carefully
-2. Use tools to gather information (file reads, code searches, etc.)
-3. Execute the task completely - be thorough
-4. Stream your progress - the user sees your work in real-time
-5. Make reasonable assumptions and state them
-
-**TOOL USAGE:**
-- Use fetch_file with with_line_numbers=true for precise file editing
-- Use code changes tools (add_file_to_changes, update_file_lines, insert_lines, delete_lines) for modifications
-- Use show_updated_file and show_diff to display your changes
-- Use bash_command for running commands if needed
-
-**OUTPUT:**
-- Stream your thinking and work as you go
-- End with "## Task Result" containing a concise, actionable summary
-- The supervisor will use your Task Result for coordination
-
 Now execute the task completely."""
 
 
@@ -11,13 +11,23 @@ from app.modules.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Process-wide Redis client; its connection pool is shared by every manager instance
+_redis_client: Optional[redis.Redis] = None
+
+
+def _get_redis_client() -> redis.Redis:
+    """Get the shared Redis client, creating it on first use"""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.from_url(ConfigProvider().get_redis_url())
+    return _redis_client
+
 
 class ToolCallStreamManager:
     """Manages Redis streams for tool call responses using call_id as the stream key"""
 
     def __init__(self):
-        config = ConfigProvider()
-        self.redis_client = redis.from_url(config.get_redis_url())
+        self.redis_client = _get_redis_client()
         # Use same TTL and max_len as conversation streams
         self.stream_ttl = ConfigProvider.get_stream_ttl_secs()
         self.max_len = ConfigProvider.get_stream_maxlen()
@@ -32,10 +42,11 @@ class ToolCallStreamManager:
         event_data: dict,
     ):
         """Synchronous Redis publish - called from thread pool"""
-        # Publish to stream with max length limit
-        self.redis_client.xadd(key, event_data, maxlen=self.max_len, approximate=True)
-        # Refresh TTL
-        self.redis_client.expire(key, self.stream_ttl)
+        # Publish with max length limit and refresh TTL in a single round trip
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.xadd(key, event_data, maxlen=self.max_len, approximate=True)
+        pipe.expire(key, self.stream_ttl)
+        pipe.execute()
 
     def publish_stream_part(
         self,
@@ -133,7 +144,7 @@ class ToolCallStreamManager:
 
         try:
             # Run synchronous Redis operations in thread pool to avoid blocking event loop
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None,  # Use default thread pool
                 partial(self._sync_publish_stream_part, key, event_data),
@@ -147,10 +158,10 @@ class ToolCallStreamManager:
 
     def _sync_publish_end_event(self, key: str, end_event_data: dict):
         """Synchronous Redis publish for end event - called from thread pool"""
-        self.redis_client.xadd(
-            key, end_event_data, maxlen=self.max_len, approximate=True
-        )
-        self.redis_client.expire(key, self.stream_ttl)
+        pipe = self.redis_client.pipeline(transaction=False)
+        pipe.xadd(key, end_event_data, maxlen=self.max_len, approximate=True)
+        pipe.expire(key, self.stream_ttl)
+        pipe.execute()
 
     def publish_complete(
         self,
@@ -212,7 +223,7 @@ class ToolCallStreamManager:
             "created_at": datetime.utcnow().isoformat(),
         }
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             await loop.run_in_executor(
                 None, partial(self._sync_publish_end_event, key, end_event_data)
             )
@@ -234,7 +245,7 @@ class ToolCallStreamManager:
         key = self.stream_key(call_id)
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             # Only replay existing events if cursor is explicitly provided
             events = []
@@ -296,7 +307,6 @@ class ToolCallStreamManager:
             while True:
                 # Check if key still exists (TTL expiry detection)
                 # Run in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
                 key_exists = await loop.run_in_executor(
                     None, self.redis_client.exists, key
                 )
@@ -349,18 +359,19 @@ class ToolCallStreamManager:
         stream_id_str = event_id.decode() if isinstance(event_id, bytes) else event_id
         formatted = {"stream_id": stream_id_str}
 
+        # Bind hot-loop lookups locally; this runs for every event a consumer reads
+        loads = json.loads
         for k, v in event_data.items():
-            key_str = k.decode() if isinstance(k, bytes) else k
-            value_str = v.decode() if isinstance(v, bytes) else v
+            key_str = k.decode() if type(k) is bytes else k
+            value_str = v.decode() if type(v) is bytes else v
 
             if key_str.endswith("_json"):
+                formatted_key = key_str.replace("_json", "")
                 try:
-                    parsed_value = json.loads(value_str)
-                    formatted_key = key_str.replace("_json", "")
-                    formatted[formatted_key] = parsed_value
+                    formatted[formatted_key] = loads(value_str)
                 except Exception as e:
                     logger.error(f"Failed to parse {key_str}: {value_str}, error: {e}")
-                    formatted[key_str.replace("_json", "")] = {}
+                    formatted[formatted_key] = {}
             else:
                 formatted[key_str] = value_str
 
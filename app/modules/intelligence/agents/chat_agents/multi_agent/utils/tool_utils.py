@@ -44,7 +44,11 @@ def handle_exception(tool_func):
 
 
 def create_tool_call_response(event: FunctionToolCallEvent) -> ToolCallResponse:
-    """Create appropriate tool call response for regular or delegation tools"""
+    """Create appropriate tool call response for regular or delegation tools
+
+    Every field is produced here from the event (ids, names and helper-formatted
+    strings), so the response is built with model_construct, without re-validation.
+    """
     tool_name = event.part.tool_name
 
     # Safely parse tool arguments with error handling for malformed JSON
@@ -82,7 +86,7 @@ def create_tool_call_response(event: FunctionToolCallEvent) -> ToolCallResponse:
         task_description = args_dict.get("task_description", "")
         context = args_dict.get("context", "")
 
-        return ToolCallResponse(
+        return ToolCallResponse.model_construct(
             call_id=event.part.tool_call_id or "",
             event_type=ToolCallEventType.DELEGATION_CALL,
             tool_name=tool_name,
@@ -94,7 +98,7 @@ def create_tool_call_response(event: FunctionToolCallEvent) -> ToolCallResponse:
             },
         )
     else:
-        return ToolCallResponse(
+        return ToolCallResponse.model_construct(
             call_id=event.part.tool_call_id or "",
             event_type=ToolCallEventType.CALL,
             tool_name=tool_name,
@@ -106,14 +110,17 @@ def create_tool_call_response(event: FunctionToolCallEvent) -> ToolCallResponse:
 
 
 def create_tool_result_response(event: FunctionToolResultEvent) -> ToolCallResponse:
-    """Create appropriate tool result response for regular or delegation tools"""
+    """Create appropriate tool result response for regular or delegation tools
+
+    Like create_tool_call_response, the fields are built here and skip re-validation.
+    """
     tool_name = event.result.tool_name or "unknown tool"
 
     if is_delegation_tool(tool_name):
         agent_type = extract_agent_type_from_delegation_tool(tool_name)
         result_content = str(event.result.content) if event.result.content else ""
 
-        return ToolCallResponse(
+        return ToolCallResponse.model_construct(
             call_id=event.result.tool_call_id or "",
             event_type=ToolCallEventType.DELEGATION_RESULT,
             tool_name=tool_name,
@@ -124,7 +131,7 @@ def create_tool_result_response(event: FunctionToolResultEvent) -> ToolCallRespo
             is_complete=True,  # Explicitly mark delegation results as complete
         )
     else:
-        return ToolCallResponse(
+        return ToolCallResponse.model_construct(
             call_id=event.result.tool_call_id or "",
             event_type=ToolCallEventType.RESULT,
             tool_name=tool_name,
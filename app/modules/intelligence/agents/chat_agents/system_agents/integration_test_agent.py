@@ -9,11 +9,12 @@ from app.modules.intelligence.provider.exceptions import UnsupportedProviderErro
 from app.modules.intelligence.provider.provider_service import ProviderService
 from app.modules.intelligence.tools.tool_service import ToolService
 from ...chat_agent import ChatAgent, ChatAgentResponse, ChatContext
-from typing import AsyncGenerator, List
-from pydantic import BaseModel
+from typing import AsyncGenerator, List, NamedTuple
 
 
-class NodeContext(BaseModel):
+class NodeContext(NamedTuple):
+    """Graph node reference collected while enriching the context"""
+
     node_id: str
     name: str
 
@@ -104,17 +105,11 @@ class IntegrationTestAgent(ChatAgent):
                 unique_node_contexts.append(node)
 
         # Format graphs for better readability in the prompt
+        node_names = {node.node_id: node.name for node in unique_node_contexts}
         formatted_graphs = {}
         for node_id, graph in graphs.items():
             formatted_graphs[node_id] = {
-                "name": next(
-                    (
-                        node.name
-                        for node in unique_node_contexts
-                        if node.node_id == node_id
-                    ),
-                    "Unknown",
-                ),
+                "name": node_names.get(node_id, "Unknown"),
                 "structure": graph["graph"]["root_node"],
             }
 
@@ -1,3 +1,4 @@
+import asyncio
 from app.modules.intelligence.agents.chat_agents.agent_config import (
     AgentConfig,
     TaskConfig,
@@ -111,19 +112,24 @@ class LowLevelDesignAgent(ChatAgent):
             return PydanticRagAgent(self.llm_provider, agent_config, tools)
 
     async def _enriched_context(self, ctx: ChatContext) -> ChatContext:
+        fetch_file_structure = (
+            self.tools_provider.file_structure_tool.fetch_repo_structure(ctx.project_id)
+        )
         if ctx.node_ids and len(ctx.node_ids) > 0:
-            code_results = await self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
-                ctx.project_id, ctx.node_ids
+            # Node code and repo structure are independent; fetch them concurrently.
+            # Both stay on the event loop because they share the request's db session
+            code_results, file_structure = await asyncio.gather(
+                self.tools_provider.get_code_from_multiple_node_ids_tool.run_multiple(
+                    ctx.project_id, ctx.node_ids
+                ),
+                fetch_file_structure,
             )
             ctx.additional_context += (
                 f"Code Graph context of the node_ids in query:\n {code_results}"
             )
+        else:
+            file_structure = await fetch_file_structure
 
-        file_structure = (
-            await self.tools_provider.file_structure_tool.fetch_repo_structure(
-                ctx.project_id
-            )
-        )
         ctx.additional_context += f"File Structure of the project:\n {file_structure}"
 
         return ctx
@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, TypedDict
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 from sqlalchemy.exc import SQLAlchemyError
@@ -20,10 +20,18 @@ class ChatHistoryServiceError(Exception):
     """Base exception class for ChatHistoryService errors."""
 
 
+class _MessageBuffer(TypedDict):
+    """Streamed content and citations buffered for one conversation."""
+
+    content: str
+    # Ordered set of citations
+    citations: Dict[str, None]
+
+
 class ChatHistoryService:
     def __init__(self, db: Session):
         self.db = db
-        self.message_buffer: Dict[str, Dict[str, str]] = {}
+        self.message_buffer: Dict[str, _MessageBuffer] = {}
 
     def get_session_history(
         self, user_id: str, conversation_id: str
@@ -74,10 +82,13 @@ class ChatHistoryService:
         citations: Optional[List[str]] = None,
     ):
         if conversation_id not in self.message_buffer:
-            self.message_buffer[conversation_id] = {"content": "", "citations": []}
+            self.message_buffer[conversation_id] = {"content": "", "citations": {}}
         self.message_buffer[conversation_id]["content"] += content
         if citations:
-            self.message_buffer[conversation_id]["citations"].extend(citations)
+            # Dict keys act as an insertion-ordered set, deduplicating as chunks arrive
+            self.message_buffer[conversation_id]["citations"].update(
+                dict.fromkeys(citations)
+            )
         logger.debug(
             f"Added message chunk to buffer for conversation: {conversation_id}"
         )
@@ -103,13 +114,11 @@ class ChatHistoryService:
                     sender_id=sender_id if message_type == MessageType.HUMAN else None,
                     type=message_type,
                     created_at=datetime.now(timezone.utc),
-                    citations=(
-                        ",".join(set(citations)) if citations else None
-                    ),  # Use set to remove duplicates
+                    citations=(",".join(citations) if citations else None),
                 )
                 self.db.add(new_message)
                 self.db.commit()
-                self.message_buffer[conversation_id] = {"content": "", "citations": []}
+                self.message_buffer[conversation_id] = {"content": "", "citations": {}}
                 logger.info(
                     f"Flushed message buffer for conversation: {conversation_id}"
                 )
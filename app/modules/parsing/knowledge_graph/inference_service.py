@@ -367,6 +367,10 @@ class InferenceService:
         cache_misses = 0
         uncacheable_nodes = 0
 
+        # Cache lookups already made in this run (content_hash -> inference or None),
+        # so duplicated code doesn't repeat the same database round trip
+        cache_lookups: Dict[str, Optional[Dict[str, Any]]] = {}
+
         # Get database session for cache operations
         cache_service = None
         db = None
@@ -437,7 +441,11 @@ class InferenceService:
 
                 # Check cache for existing inference
                 # Simplified - project_id parameter ignored by cache service
-                cached_inference = cache_service.get_cached_inference(content_hash)
+                if content_hash in cache_lookups:
+                    cached_inference = cache_lookups[content_hash]
+                else:
+                    cached_inference = cache_service.get_cached_inference(content_hash)
+                    cache_lookups[content_hash] = cached_inference
 
                 if cached_inference:
                     # Cache hit - store inference directly in node
@@ -1000,6 +1008,12 @@ class InferenceService:
         embedding = self.embedding_model.encode(text)
         return embedding.tolist()
 
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Embed many texts with one batched encode call"""
+        if not texts:
+            return []
+        return self.embedding_model.encode(texts).tolist()
+
     async def update_neo4j_with_cached_inference(self, node: Dict[str, Any]) -> None:
         """Update Neo4j with cached inference data for a single node"""
         cached_inference = node.get("cached_inference", {})
@@ -1047,16 +1061,23 @@ class InferenceService:
         logger.debug(f"Updated Neo4j with cached inference for node {node['node_id']}")
 
     def update_neo4j_with_docstrings(self, repo_id: str, docstrings: DocstringResponse):
+        # Nothing to write; skip the session, project lookup and embedding call
+        if not docstrings.docstrings:
+            return
         with self.driver.session() as session:
             batch_size = 300
+            # Encode every docstring in one batched call, then pair embeddings with rows
+            embeddings = self.generate_embeddings(
+                [n.docstring for n in docstrings.docstrings]
+            )
             docstring_list = [
                 {
                     "node_id": n.node_id,
                     "docstring": n.docstring,
                     "tags": n.tags,
-                    "embedding": self.generate_embedding(n.docstring),
+                    "embedding": embedding,
                 }
-                for n in docstrings.docstrings
+                for n, embedding in zip(docstrings.docstrings, embeddings)
             ]
             project = self.project_manager.get_project_from_db_by_id_sync(repo_id)
             repo_path = project.get("repo_path")